@@ -17,41 +17,178 @@ Test scenarios: 50+ diverse traffic patterns
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
+import matplotlib
+from matplotlib.figure import Figure
 import pandas as pd
+import rrc_simulation_engine
 from rrc_simulation_engine import RRCSimulationEngine, RRCState
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import gc
+import hashlib
+import os
+import pickle
 import time
 
 
+def _split_schedule(data_pattern) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split a burst pattern into contiguous int64 (times, durations) arrays.
+    
+    Patterns from generate_test_scenarios are already sorted by time and
+    are used as-is; anything else is stably sorted first so that, for
+    bursts sharing a start time, the later entry still wins.
+    """
+    schedule = np.asarray(data_pattern, dtype=np.int64).reshape(-1, 2)
+    times = schedule[:, 0]
+    if len(times) > 1 and (times[1:] < times[:-1]).any():
+        schedule = schedule[np.argsort(times, kind='stable')]
+    return np.ascontiguousarray(schedule[:, 0]), np.ascontiguousarray(schedule[:, 1])
+
+
+# Row layout of TimerComparativeStudy.results (one record per scenario × config).
+# All metrics fit 32-bit types: energies are integer sums below 2**24, so
+# float32 holds them exactly, and halving the width speeds up every groupby.
+RESULT_DTYPE = np.dtype([
+    ('scenario', 'U64'),
+    ('config', 'U32'),
+    ('total_energy', 'f4'),
+    ('transitions', 'i4'),
+    ('idle_time_ms', 'i4'),
+    ('connected_time_ms', 'i4'),
+    ('inactive_time_ms', 'i4'),
+    ('idle_pct', 'f4'),
+    ('connected_pct', 'f4'),
+    ('inactive_pct', 'f4'),
+    ('efficiency', 'f4'),
+    ('avg_energy_per_sec', 'f4'),
+    ('data_bursts', 'i2'),
+    ('category', 'U16'),
+])
+
+
+# Bump when simulation semantics change so stale cached results are ignored
+_CACHE_VERSION = 3
+
+
+def _source_fingerprint() -> str:
+    """Hash of the engine and study sources, so any code edit invalidates the cache"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (rrc_simulation_engine.__file__, __file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+_SOURCE_FINGERPRINT = _source_fingerprint()
+
+
+def _cache_key(scenario: Dict, config: Dict) -> str:
+    """Hash the inputs and the simulation code that fully determine a run_scenario result"""
+    schedule = np.asarray(scenario['pattern'], dtype=np.int64).reshape(-1, 2)
+    header = repr((_CACHE_VERSION, _SOURCE_FINGERPRINT, scenario['name'], scenario['duration'],
+                   sorted(config.items())))
+    return hashlib.blake2b(header.encode() + schedule.tobytes(), digest_size=16).hexdigest()
+
+
+def _run_one(task: Tuple[Dict, Dict, Optional[str]]) -> Tuple[float, int, int, int, int]:
+    """
+    Run one (scenario, config) pair in a worker process.
+    
+    Only the raw counters cross the process boundary as a plain tuple;
+    names, percentages and efficiency are filled in by the parent in one
+    vectorized pass (see _fill_derived_metrics).
+    
+    Results are memoized on disk under cache_dir, keyed by a hash of the
+    scenario pattern, duration, timer config and the engine/study source
+    (see _source_fingerprint), so repeated studies only pay for pairs that
+    have not been simulated with the current code.
+    
+    Args:
+        task: (scenario_dict, config_dict, cache_dir) tuple, as built by
+              run_comparative_study. cache_dir=None disables caching.
+        
+    Returns:
+        (total_energy, transitions, idle_ms, connected_ms, inactive_ms)
+    """
+    scenario, config, cache_dir = task
+    
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, _cache_key(scenario, config) + '.pkl')
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+    
+    counts = TimerComparativeStudy.simulate_counts(
+        data_pattern=scenario['pattern'],
+        duration_ms=scenario['duration'],
+        timer_config=config
+    )
+    
+    if cache_path:
+        # Write-then-rename so concurrent workers never see a partial file
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(counts, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    
+    return counts
+
+
+def _fill_derived_metrics(results: np.ndarray, durations_ms: np.ndarray):
+    """
+    Compute percentage, efficiency and energy-rate fields of RESULT_DTYPE
+    records in place from their raw counters.
+    
+    Args:
+        results: Structured array with the raw counter fields filled in
+        durations_ms: Simulation duration of each record
+    """
+    total_time = durations_ms.astype(np.float64)
+    idle = results['idle_time_ms'].astype(np.float64)
+    connected = results['connected_time_ms'].astype(np.float64)
+    results['idle_pct'] = idle / total_time * 100
+    results['connected_pct'] = connected / total_time * 100
+    results['inactive_pct'] = results['inactive_time_ms'] / total_time * 100
+    
+    # Network efficiency: ratio of CONNECTED time to non-IDLE time
+    non_idle_time = total_time - idle
+    with np.errstate(divide='ignore', invalid='ignore'):
+        results['efficiency'] = np.where(non_idle_time > 0, connected / non_idle_time * 100, 0)
+    
+    # Average energy per second
+    results['avg_energy_per_sec'] = results['total_energy'].astype(np.float64) / (total_time / 1000.0)
+
+
 class TimerComparativeStudy:
     """
     Comparative analysis framework for RRC timer strategies.
     """
     
     def __init__(self):
-        self.results = []
+        self.results = np.empty(0, dtype=RESULT_DTYPE)
+        self.config_names: List[str] = []
         self.test_count = 0
         
-    def run_scenario(self, 
-                     scenario_name: str,
-                     data_pattern: List[Tuple[int, int]],  # [(time_ms, burst_duration_ms), ...]
-                     duration_ms: int,
-                     timer_config: Dict,
-                     config_name: str) -> Dict:
+    @staticmethod
+    def simulate_counts(data_pattern: np.ndarray,
+                        duration_ms: int,
+                        timer_config: Dict) -> Tuple[float, int, int, int, int]:
         """
-        Run a single test scenario.
+        Simulate one scenario and return only the raw counters.
         
         Args:
-            scenario_name: Name of the test scenario
-            data_pattern: List of (time, burst_duration) tuples
+            data_pattern: (N, 2) array (or list) of (time, burst_duration) pairs
             duration_ms: Total simulation duration
             timer_config: Timer configuration dict
-            config_name: "Static" or "Adaptive-{profile}"
             
         Returns:
-            Dictionary of metrics
+            (total_energy, transitions, idle_ms, connected_ms, inactive_ms)
         """
         engine = RRCSimulationEngine()
         
@@ -64,41 +201,66 @@ class TimerComparativeStudy:
             # Adaptive configuration - use profile
             engine.set_traffic_profile(timer_config['profile'])
         
-        # Schedule data bursts
-        data_schedule = {t: duration for t, duration in data_pattern}
+        # Burst schedule as two parallel arrays sorted by time, consumed
+        # with a single advancing index instead of a per-tick dict probe
+        burst_times, burst_durs = _split_schedule(data_pattern)
+        
+        # Hand the whole schedule to the engine: with Numba it runs in the
+        # engine's compiled kernel, otherwise it only ticks individually
+        # where the state machine can change
+        engine.run_vectorized(duration_ms, burst_times, burst_durs)
+        
+        state_info = engine.get_state()
+        state_durations = state_info['state_durations']
+        return (state_info['total_energy'], state_info['transition_count'],
+                state_durations[RRCState.IDLE], state_durations[RRCState.CONNECTED],
+                state_durations[RRCState.INACTIVE])
+    
+    @staticmethod
+    def run_scenario(scenario_name: str,
+                     data_pattern: np.ndarray,  # [(time_ms, burst_duration_ms), ...]
+                     duration_ms: int,
+                     timer_config: Dict,
+                     config_name: str) -> Dict:
+        """
+        Run a single test scenario.
         
-        # Run simulation
-        for tick in range(duration_ms):
-            # Trigger scheduled data bursts
-            if tick in data_schedule:
-                engine.trigger_data_request(burst_duration_ms=data_schedule[tick])
+        Args:
+            scenario_name: Name of the test scenario
+            data_pattern: (N, 2) array (or list) of (time, burst_duration) pairs
+            duration_ms: Total simulation duration
+            timer_config: Timer configuration dict
+            config_name: "Static" or "Adaptive-{profile}"
             
-            engine.tick()
+        Returns:
+            Dictionary of metrics
+        """
+        total_energy, transition_count, idle_ms, connected_ms, inactive_ms = \
+            TimerComparativeStudy.simulate_counts(data_pattern, duration_ms, timer_config)
         
         # Collect metrics
-        state_info = engine.get_state()
         total_time = duration_ms
         
         # Calculate percentages and derived metrics
-        idle_pct = (state_info['state_durations'][RRCState.IDLE] / total_time) * 100
-        connected_pct = (state_info['state_durations'][RRCState.CONNECTED] / total_time) * 100
-        inactive_pct = (state_info['state_durations'][RRCState.INACTIVE] / total_time) * 100
+        idle_pct = (idle_ms / total_time) * 100
+        connected_pct = (connected_ms / total_time) * 100
+        inactive_pct = (inactive_ms / total_time) * 100
         
         # Network efficiency: ratio of CONNECTED time to non-IDLE time
-        non_idle_time = total_time - state_info['state_durations'][RRCState.IDLE]
-        efficiency = (state_info['state_durations'][RRCState.CONNECTED] / non_idle_time * 100) if non_idle_time > 0 else 0
+        non_idle_time = total_time - idle_ms
+        efficiency = (connected_ms / non_idle_time * 100) if non_idle_time > 0 else 0
         
         # Average energy per second
-        avg_energy_per_sec = state_info['total_energy'] / (total_time / 1000.0)
+        avg_energy_per_sec = total_energy / (total_time / 1000.0)
         
         return {
             'scenario': scenario_name,
             'config': config_name,
-            'total_energy': state_info['total_energy'],
-            'transitions': state_info['transition_count'],
-            'idle_time_ms': state_info['state_durations'][RRCState.IDLE],
-            'connected_time_ms': state_info['state_durations'][RRCState.CONNECTED],
-            'inactive_time_ms': state_info['state_durations'][RRCState.INACTIVE],
+            'total_energy': total_energy,
+            'transitions': transition_count,
+            'idle_time_ms': idle_ms,
+            'connected_time_ms': connected_ms,
+            'inactive_time_ms': inactive_ms,
             'idle_pct': idle_pct,
             'connected_pct': connected_pct,
             'inactive_pct': inactive_pct,
@@ -107,10 +269,20 @@ class TimerComparativeStudy:
             'data_bursts': len(data_pattern)
         }
     
+    @staticmethod
+    def _periodic_pattern(stop_ms: int, interval_ms: int, burst_ms: int) -> np.ndarray:
+        """Bursts of burst_ms every interval_ms over [0, stop_ms), as an (N, 2) int64 array"""
+        times = np.arange(0, stop_ms, interval_ms, dtype=np.int64)
+        return np.column_stack([times, np.full_like(times, burst_ms)])
+    
     def generate_test_scenarios(self) -> List[Dict]:
         """
         Generate 50+ diverse test scenarios covering various traffic patterns.
         
+        Each pattern is an (N, 2) int64 array of (time_ms, burst_duration_ms)
+        rows sorted by time, built with bulk NumPy operations, so it can be
+        handed to the simulator without any per-run conversion.
+        
         Returns:
             List of scenario configurations
         """
@@ -121,7 +293,7 @@ class TimerComparativeStudy:
         for interval_ms in [500, 1000, 2000, 5000, 10000]:
             for burst_duration in [50, 100]:
                 duration = 30000  # 30 seconds
-                pattern = [(t, burst_duration) for t in range(0, duration, interval_ms)]
+                pattern = self._periodic_pattern(duration, interval_ms, burst_duration)
                 scenarios.append({
                     'name': f'IoT_Sensor_{interval_ms}ms_interval_{burst_duration}ms_burst',
                     'pattern': pattern,
@@ -134,7 +306,7 @@ class TimerComparativeStudy:
         for session_duration in [5000, 10000, 15000, 20000, 30000]:
             for burst_rate in [50, 100]:  # Frame rate simulation
                 duration = session_duration + 10000  # Add idle time after
-                pattern = [(t, 20) for t in range(0, session_duration, burst_rate)]
+                pattern = self._periodic_pattern(session_duration, burst_rate, 20)
                 scenarios.append({
                     'name': f'Streaming_{session_duration}ms_{burst_rate}ms_rate',
                     'pattern': pattern,
@@ -147,15 +319,14 @@ class TimerComparativeStudy:
         for num_pages in [3, 5, 7, 10, 15]:
             for page_load_time in [500, 1000]:
                 duration = num_pages * 8000  # Pages spread over time
-                pattern = []
-                for i in range(num_pages):
-                    page_start = i * (duration // num_pages)
-                    # Multiple bursts per page load
-                    pattern.extend([
-                        (page_start, 100),
-                        (page_start + 200, 150),
-                        (page_start + 500, page_load_time),
-                    ])
+                page_starts = np.arange(num_pages, dtype=np.int64) * (duration // num_pages)
+                # Multiple bursts per page load
+                offsets = np.array([0, 200, 500], dtype=np.int64)
+                bursts = np.array([100, 150, page_load_time], dtype=np.int64)
+                pattern = np.column_stack([
+                    (page_starts[:, None] + offsets).ravel(),
+                    np.tile(bursts, num_pages),
+                ])
                 scenarios.append({
                     'name': f'Web_Browse_{num_pages}_pages_{page_load_time}ms_load',
                     'pattern': pattern,
@@ -167,15 +338,13 @@ class TimerComparativeStudy:
         print("Generating mixed traffic scenarios...")
         for test_id in range(10):
             duration = 40000
-            pattern = []
-            # Random mix of short and long bursts
-            np.random.seed(test_id)
-            num_bursts = np.random.randint(10, 30)
-            for _ in range(num_bursts):
-                t = np.random.randint(0, duration - 1000)
-                burst_len = np.random.choice([50, 100, 200, 500, 1000])
-                pattern.append((t, burst_len))
-            pattern.sort()  # Sort by time
+            # Random mix of short and long bursts (one batched draw per column)
+            rng = np.random.default_rng(test_id)
+            num_bursts = int(rng.integers(10, 30))
+            t = rng.integers(0, duration - 1000, size=num_bursts, dtype=np.int64)
+            burst_len = rng.choice(np.array([50, 100, 200, 500, 1000], dtype=np.int64), size=num_bursts)
+            order = np.lexsort((burst_len, t))  # Sort by time
+            pattern = np.column_stack([t[order], burst_len[order]])
             scenarios.append({
                 'name': f'Mixed_Traffic_{test_id}',
                 'pattern': pattern,
@@ -189,7 +358,7 @@ class TimerComparativeStudy:
         # Very sparse
         scenarios.append({
             'name': 'Edge_Very_Sparse',
-            'pattern': [(5000, 50), (25000, 50)],
+            'pattern': np.array([(5000, 50), (25000, 50)], dtype=np.int64),
             'duration': 30000,
             'category': 'Edge'
         })
@@ -197,7 +366,7 @@ class TimerComparativeStudy:
         # Very dense
         scenarios.append({
             'name': 'Edge_Very_Dense',
-            'pattern': [(t, 50) for t in range(0, 10000, 100)],
+            'pattern': self._periodic_pattern(10000, 100, 50),
             'duration': 15000,
             'category': 'Edge'
         })
@@ -205,22 +374,20 @@ class TimerComparativeStudy:
         # Single long burst
         scenarios.append({
             'name': 'Edge_Single_Long',
-            'pattern': [(1000, 5000)],
+            'pattern': np.array([(1000, 5000)], dtype=np.int64),
             'duration': 20000,
             'category': 'Edge'
         })
         
-        # Increasing frequency
+        # Increasing frequency: gaps shrink every 3 bursts
+        interval = 2000
+        gaps = interval // (1 + np.arange(14, dtype=np.int64) // 3)
+        times = np.concatenate([[0], np.cumsum(gaps)])
+        times = times[times < 30000]
         for i in range(7):
-            pattern = []
-            interval = 2000
-            for j in range(15):
-                t = sum([interval // (1 + k//3) for k in range(j)])
-                if t < 30000:
-                    pattern.append((t, 100))
             scenarios.append({
                 'name': f'Edge_Increasing_Freq_{i}',
-                'pattern': pattern,
+                'pattern': np.column_stack([times, np.full_like(times, 100)]),
                 'duration': 30000,
                 'category': 'Edge'
             })
@@ -228,9 +395,16 @@ class TimerComparativeStudy:
         print(f"Generated {len(scenarios)} test scenarios")
         return scenarios
     
-    def run_comparative_study(self):
+    def run_comparative_study(self, max_workers: int = None, cache_dir: Optional[str] = '.cache_rrc'):
         """
         Run full comparative study: Static vs. Adaptive configurations.
+        
+        Each (scenario, config) pair is independent, so the sweep is spread
+        across a process pool.
+        
+        Args:
+            max_workers: Number of worker processes (default: os.cpu_count())
+            cache_dir: Directory for memoized scenario results (None disables)
         """
         print("="*70)
         print("RRC TIMER COMPARATIVE STUDY")
@@ -252,371 +426,366 @@ class TimerComparativeStudy:
             {'name': 'Adaptive_Streaming', 'profile': 'Streaming'},
         ]
         
-        total_tests = len(scenarios) * len(configs)
-        current_test = 0
+        self.config_names = [config['name'] for config in configs]
+        
+        tasks = [(scenario, config, cache_dir) for scenario in scenarios for config in configs]
+        total_tests = len(tasks)
         
         print(f"Running {total_tests} total tests ({len(scenarios)} scenarios × {len(configs)} configs)")
         print()
         
         start_time = time.time()
         
-        for scenario in scenarios:
-            for config in configs:
-                current_test += 1
-                print(f"[{current_test}/{total_tests}] {scenario['name'][:40]:40s} | {config['name']:20s}", end='\r')
-                
-                result = self.run_scenario(
-                    scenario_name=scenario['name'],
-                    data_pattern=scenario['pattern'],
-                    duration_ms=scenario['duration'],
-                    timer_config=config,
-                    config_name=config['name']
-                )
-                result['category'] = scenario['category']
-                self.results.append(result)
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            counts = []
+            for i, result in enumerate(executor.map(_run_one, tasks, chunksize=4)):
+                scenario, config, _ = tasks[i]
+                print(f"[{i + 1}/{total_tests}] {scenario['name'][:40]:40s} | {config['name']:20s}", end='\r')
+                counts.append(result)
+        counts = np.array(counts, dtype=np.float64).reshape(-1, 5)
+        
+        # Preallocated structured array: one typed record per test, filled
+        # column by column
+        results = np.zeros(total_tests, dtype=RESULT_DTYPE)
+        results['scenario'] = [scenario['name'] for scenario, _, _ in tasks]
+        results['config'] = [config['name'] for _, config, _ in tasks]
+        results['category'] = [scenario['category'] for scenario, _, _ in tasks]
+        results['data_bursts'] = [len(scenario['pattern']) for scenario, _, _ in tasks]
+        for column, field in enumerate(('total_energy', 'transitions', 'idle_time_ms',
+                                        'connected_time_ms', 'inactive_time_ms')):
+            results[field] = counts[:, column]
+        durations_ms = np.array([scenario['duration'] for scenario, _, _ in tasks], dtype=np.int64)
+        _fill_derived_metrics(results, durations_ms)
+        self.results = np.concatenate([self.results, results])
         
         elapsed = time.time() - start_time
         print(f"\n\n[OK] Completed {total_tests} tests in {elapsed:.2f}s")
         print()
         
+    def _results_frame(self) -> pd.DataFrame:
+        """
+        Build the results DataFrame with categorical config/category columns.
+        
+        Categoricals turn the repeated config/category comparisons and
+        groupbys into small-integer code operations.
+        """
+        df = pd.DataFrame(self.results)
+        config_names = self.config_names or list(pd.unique(df['config']))
+        df['config'] = pd.Categorical(df['config'], categories=config_names, ordered=True)
+        df['category'] = df['category'].astype('category')
+        return df
+    
     def analyze_results(self):
         """
         Analyze and print statistical summary of results.
         """
-        df = pd.DataFrame(self.results)
+        df = self._results_frame()
         
         print("="*70)
         print("STATISTICAL ANALYSIS")
         print("="*70)
         print()
         
-        # Group by configuration
-        for config_name in df['config'].unique():
-            config_df = df[df['config'] == config_name]
+        # Group by configuration (single pass over the results)
+        summary = df.groupby('config', observed=True, sort=False).agg(
+            energy=('total_energy', 'mean'),
+            trans=('transitions', 'mean'),
+            idle=('idle_pct', 'mean'),
+            conn=('connected_pct', 'mean'),
+            inact=('inactive_pct', 'mean'),
+            eff=('efficiency', 'mean'),
+        )
+        for config_name, row in summary.iterrows():
             print(f"\n{config_name}:")
-            print(f"  Average Energy:      {config_df['total_energy'].mean():>12,.0f} units")
-            print(f"  Average Transitions: {config_df['transitions'].mean():>12,.1f}")
-            print(f"  Average IDLE:        {config_df['idle_pct'].mean():>12,.1f}%")
-            print(f"  Average CONNECTED:   {config_df['connected_pct'].mean():>12,.1f}%")
-            print(f"  Average INACTIVE:    {config_df['inactive_pct'].mean():>12,.1f}%")
-            print(f"  Average Efficiency:  {config_df['efficiency'].mean():>12,.1f}%")
+            print(f"  Average Energy:      {row['energy']:>12,.0f} units")
+            print(f"  Average Transitions: {row['trans']:>12,.1f}")
+            print(f"  Average IDLE:        {row['idle']:>12,.1f}%")
+            print(f"  Average CONNECTED:   {row['conn']:>12,.1f}%")
+            print(f"  Average INACTIVE:    {row['inact']:>12,.1f}%")
+            print(f"  Average Efficiency:  {row['eff']:>12,.1f}%")
         
         print()
         print("="*70)
         print("CATEGORY BREAKDOWN")
         print("="*70)
         
-        for category in df['category'].unique():
-            cat_df = df[df['category'] == category]
+        category_energy = (df.groupby(['category', 'config'], observed=True, sort=False)['total_energy']
+                           .mean()
+                           .unstack()
+                           .reindex(index=df['category'].unique(), columns=summary.index))
+        for category, energies in category_energy.iterrows():
             print(f"\n{category} Traffic:")
-            for config_name in df['config'].unique():
-                config_cat_df = cat_df[cat_df['config'] == config_name]
-                if len(config_cat_df) > 0:
-                    print(f"  {config_name:20s}: Avg Energy = {config_cat_df['total_energy'].mean():>10,.0f} units")
+            for config_name, energy in energies.dropna().items():
+                print(f"  {config_name:20s}: Avg Energy = {energy:>10,.0f} units")
+    
+    def export_results(self, basename: str = 'comparative_study_data', csv: bool = False) -> str:
+        """
+        Export raw results to disk.
+        
+        Parquet (zstd, dictionary-encoded config/category columns) is the
+        default; it needs pyarrow or fastparquet, and CSV is written instead
+        when neither is installed.
+        
+        Args:
+            basename: Output path without extension
+            csv: Write CSV instead of Parquet
+            
+        Returns:
+            Path of the written file
+        """
+        df = self._results_frame()
+        if not csv:
+            parquet_file = f"{basename}.parquet"
+            try:
+                df.to_parquet(parquet_file, compression='zstd', index=False)
+                return parquet_file
+            except ImportError:
+                print("\n[!] pyarrow/fastparquet not installed - falling back to CSV export")
+        csv_file = f"{basename}.csv"
+        df.to_csv(csv_file, index=False)
+        return csv_file
     
-    def plot_results(self, output_dir='results'):
+    def plot_results(self, output_dir='results', max_workers: int = None):
         """
         Generate comprehensive visualization of results as separate files.
         
+        The 7 plots are independent, so they are rendered in parallel
+        worker processes.
+        
         Args:
             output_dir: Directory to save plots (default: 'results')
+            max_workers: Number of worker processes (default: one per plot, capped at os.cpu_count())
         """
-        import os
-        
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        df = pd.DataFrame(self.results)
-        configs = df['config'].unique()
-        categories = df['category'].unique()
-        
-        # Color scheme
-        colors = plt.cm.Set3(np.linspace(0, 1, len(configs)))
-        config_colors = {config: colors[i] for i, config in enumerate(configs)}
+        df = self._results_frame()
         
         print(f"\nGenerating individual plots in '{output_dir}/' folder...")
         
-        # ===== Plot 1: Energy Consumption by Configuration =====
-        fig1, ax1 = plt.subplots(figsize=(10, 6))
-        energy_by_config = df.groupby('config')['total_energy'].mean()
-        bars = ax1.bar(range(len(energy_by_config)), energy_by_config.values, 
-                       color=[config_colors[c] for c in energy_by_config.index],
-                       edgecolor='black', linewidth=1.5)
-        ax1.set_xticks(range(len(energy_by_config)))
-        ax1.set_xticklabels(energy_by_config.index, rotation=45, ha='right', fontsize=11)
-        ax1.set_ylabel('Average Energy (units)', fontsize=12, fontweight='bold')
-        ax1.set_title('Energy Consumption by Configuration', fontsize=14, fontweight='bold', pad=20)
-        ax1.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels on bars
-        for i, (bar, val) in enumerate(zip(bars, energy_by_config.values)):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-                    f'{val:,.0f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
-        
-        plt.tight_layout()
-        plot1_path = os.path.join(output_dir, '1_energy_by_config.png')
-        plt.savefig(plot1_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"  [OK] {plot1_path}")
-        
-        # ===== Plot 2: State Distribution (Stacked Bar) =====
-        fig2, ax2 = plt.subplots(figsize=(10, 6))
-        state_data = df.groupby('config')[['idle_pct', 'connected_pct', 'inactive_pct']].mean()
-        state_data.plot(kind='bar', stacked=True, ax=ax2, 
-                       color=['#FF6B6B', '#4ECDC4', '#FFE66D'],
-                       edgecolor='black', linewidth=1.5)
-        ax2.set_ylabel('Time Distribution (%)', fontsize=12, fontweight='bold')
-        ax2.set_title('State Distribution by Configuration', fontsize=14, fontweight='bold', pad=20)
-        ax2.legend(['IDLE', 'CONNECTED', 'INACTIVE'], fontsize=11, loc='upper left')
-        ax2.set_xticklabels(ax2.get_xticklabels(), rotation=45, ha='right', fontsize=11)
-        ax2.set_xlabel('Configuration', fontsize=12, fontweight='bold')
-        ax2.grid(axis='y', alpha=0.3, linestyle='--')
-        plt.tight_layout()
-        plot2_path = os.path.join(output_dir, '2_state_distribution.png')
-        plt.savefig(plot2_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"  [OK] {plot2_path}")
-        
-        # ===== Plot 3: Transition Count =====
-        fig3, ax3 = plt.subplots(figsize=(10, 6))
-        transitions = df.groupby('config')['transitions'].mean()
-        bars = ax3.bar(range(len(transitions)), transitions.values,
-                      color=[config_colors[c] for c in transitions.index],
-                      edgecolor='black', linewidth=1.5)
-        ax3.set_xticks(range(len(transitions)))
-        ax3.set_xticklabels(transitions.index, rotation=45, ha='right', fontsize=11)
-        ax3.set_ylabel('Average Transitions', fontsize=12, fontweight='bold')
-        ax3.set_title('State Transitions by Configuration', fontsize=14, fontweight='bold', pad=20)
-        ax3.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels
-        for bar, val in zip(bars, transitions.values):
-            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-                    f'{val:.1f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
-        
-        plt.tight_layout()
-        plot3_path = os.path.join(output_dir, '3_transition_count.png')
-        plt.savefig(plot3_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"  [OK] {plot3_path}")
-        
-        # ===== Plot 4: Energy by Category =====
-        fig4, ax4 = plt.subplots(figsize=(12, 6))
-        for config in configs:
-            config_df = df[df['config'] == config]
-            category_energy = config_df.groupby('category')['total_energy'].mean()
-            ax4.plot(category_energy.index, category_energy.values, 
-                    marker='o', label=config, color=config_colors[config], 
-                    linewidth=2.5, markersize=8)
-        ax4.set_ylabel('Average Energy (units)', fontsize=12, fontweight='bold')
-        ax4.set_xlabel('Traffic Category', fontsize=12, fontweight='bold')
-        ax4.set_title('Energy Consumption by Traffic Category', fontsize=14, fontweight='bold', pad=20)
-        ax4.legend(fontsize=10, loc='best')
-        ax4.grid(alpha=0.3, linestyle='--')
-        plt.tight_layout()
-        plot4_path = os.path.join(output_dir, '4_energy_by_category.png')
-        plt.savefig(plot4_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"  [OK] {plot4_path}")
-        
-        # ===== Plot 5: Efficiency Score =====
-        fig5, ax5 = plt.subplots(figsize=(10, 6))
-        efficiency = df.groupby('config')['efficiency'].mean()
-        bars = ax5.bar(range(len(efficiency)), efficiency.values,
-                      color=[config_colors[c] for c in efficiency.index],
-                      edgecolor='black', linewidth=1.5)
-        ax5.set_xticks(range(len(efficiency)))
-        ax5.set_xticklabels(efficiency.index, rotation=45, ha='right', fontsize=11)
-        ax5.set_ylabel('Network Efficiency (%)', fontsize=12, fontweight='bold')
-        ax5.set_title('Network Efficiency Score', fontsize=14, fontweight='bold', pad=20)
-        ax5.grid(axis='y', alpha=0.3, linestyle='--')
-        ax5.axhline(y=50, color='red', linestyle='--', alpha=0.7, linewidth=2, label='Target: 50%')
-        ax5.legend(fontsize=11)
-        
-        # Add value labels
-        for bar, val in zip(bars, efficiency.values):
-            ax5.text(bar.get_x() + bar.get_width()/2, bar.get_height(), 
-                    f'{val:.1f}%', ha='center', va='bottom', fontsize=10, fontweight='bold')
-        
-        plt.tight_layout()
-        plot5_path = os.path.join(output_dir, '5_efficiency_score.png')
-        plt.savefig(plot5_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"  [OK] {plot5_path}")
-        
-        # ===== Plot 6: Energy Distribution (Box Plot) =====
-        fig6, ax6 = plt.subplots(figsize=(12, 6))
-        data_for_box = [df[df['config'] == config]['total_energy'].values for config in configs]
-        box = ax6.boxplot(data_for_box, tick_labels=configs, patch_artist=True,
-                         boxprops=dict(linewidth=1.5),
-                         medianprops=dict(color='red', linewidth=2),
-                         whiskerprops=dict(linewidth=1.5),
-                         capprops=dict(linewidth=1.5))
-        
-        for patch, config in zip(box['boxes'], configs):
-            patch.set_facecolor(config_colors[config])
-            patch.set_alpha(0.7)
-        
-        ax6.set_xticklabels(configs, rotation=45, ha='right', fontsize=11)
-        ax6.set_ylabel('Energy (units)', fontsize=12, fontweight='bold')
-        ax6.set_title('Energy Distribution - Box Plot Analysis', fontsize=14, fontweight='bold', pad=20)
-        ax6.grid(axis='y', alpha=0.3, linestyle='--')
-        plt.tight_layout()
-        plot6_path = os.path.join(output_dir, '6_energy_distribution_boxplot.png')
-        plt.savefig(plot6_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"  [OK] {plot6_path}")
-        
-        # ===== Plot 7: Category Performance Heatmap =====
-        fig7, ax7 = plt.subplots(figsize=(12, 6))
-        heatmap_data = df.pivot_table(values='total_energy', 
-                                       index='category', 
-                                       columns='config', 
-                                       aggfunc='mean')
-        im = ax7.imshow(heatmap_data.values, cmap='YlOrRd', aspect='auto')
-        ax7.set_xticks(range(len(heatmap_data.columns)))
-        ax7.set_yticks(range(len(heatmap_data.index)))
-        ax7.set_xticklabels(heatmap_data.columns, rotation=45, ha='right', fontsize=11)
-        ax7.set_yticklabels(heatmap_data.index, fontsize=11)
-        ax7.set_title('Energy Consumption Heatmap: Category × Configuration', 
-                     fontsize=14, fontweight='bold', pad=20)
-        
-        # Add values to heatmap
-        for i in range(len(heatmap_data.index)):
-            for j in range(len(heatmap_data.columns)):
-                value = heatmap_data.values[i, j]
-                text = ax7.text(j, i, f'{value:,.0f}',
-                               ha="center", va="center", 
-                               color="white" if value > heatmap_data.values.max()/2 else "black",
-                               fontsize=9, fontweight='bold')
-        
-        cbar = plt.colorbar(im, ax=ax7, label='Energy (units)')
-        cbar.ax.tick_params(labelsize=10)
-        plt.tight_layout()
-        plot7_path = os.path.join(output_dir, '7_heatmap_category_config.png')
-        plt.savefig(plot7_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        print(f"  [OK] {plot7_path}")
-        
-        print(f"\n[OK] All 7 plots saved to '{output_dir}/' folder")
-        return output_dir
-        """
-        Generate comprehensive visualization of results.
-        """
-        df = pd.DataFrame(self.results)
+        aggregates = _plot_aggregates(df)
+        tasks = [(plot_fn, df, aggregates, output_dir) for plot_fn in PLOT_FUNCTIONS]
+        workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for plot_path in executor.map(_render_plot, tasks):
+                print(f"  [OK] {plot_path}")
         
-        fig = plt.figure(figsize=(20, 12))
-        gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
-        
-        configs = df['config'].unique()
-        categories = df['category'].unique()
-        
-        # Color scheme
-        colors = plt.cm.Set3(np.linspace(0, 1, len(configs)))
-        config_colors = {config: colors[i] for i, config in enumerate(configs)}
-        
-        # 1. Energy Consumption by Configuration
-        ax1 = fig.add_subplot(gs[0, 0])
-        energy_by_config = df.groupby('config')['total_energy'].mean()
-        bars = ax1.bar(range(len(energy_by_config)), energy_by_config.values, 
-                       color=[config_colors[c] for c in energy_by_config.index])
-        ax1.set_xticks(range(len(energy_by_config)))
-        ax1.set_xticklabels(energy_by_config.index, rotation=45, ha='right')
-        ax1.set_ylabel('Average Energy (units)')
-        ax1.set_title('Energy Consumption by Configuration')
-        ax1.grid(axis='y', alpha=0.3)
-        
-        # 2. State Distribution (Stacked Bar)
-        ax2 = fig.add_subplot(gs[0, 1])
-        state_data = df.groupby('config')[['idle_pct', 'connected_pct', 'inactive_pct']].mean()
-        state_data.plot(kind='bar', stacked=True, ax=ax2, 
-                       color=['#FF6B6B', '#4ECDC4', '#FFE66D'])
-        ax2.set_ylabel('Time (%)')
-        ax2.set_title('State Distribution by Configuration')
-        ax2.legend(['IDLE', 'CONNECTED', 'INACTIVE'])
-        ax2.set_xticklabels(ax2.get_xticklabels(), rotation=45, ha='right')
-        
-        # 3. Transition Count
-        ax3 = fig.add_subplot(gs[0, 2])
-        transitions = df.groupby('config')['transitions'].mean()
-        ax3.bar(range(len(transitions)), transitions.values,
-               color=[config_colors[c] for c in transitions.index])
-        ax3.set_xticks(range(len(transitions)))
-        ax3.set_xticklabels(transitions.index, rotation=45, ha='right')
-        ax3.set_ylabel('Average Transitions')
-        ax3.set_title('State Transitions by Configuration')
-        ax3.grid(axis='y', alpha=0.3)
-        
-        # 4. Energy by Category
-        ax4 = fig.add_subplot(gs[1, 0])
-        for config in configs:
-            config_df = df[df['config'] == config]
-            category_energy = config_df.groupby('category')['total_energy'].mean()
-            ax4.plot(category_energy.index, category_energy.values, 
-                    marker='o', label=config, color=config_colors[config], linewidth=2)
-        ax4.set_ylabel('Average Energy (units)')
-        ax4.set_title('Energy by Traffic Category')
-        ax4.legend(fontsize=8)
-        ax4.grid(alpha=0.3)
-        
-        # 5. Efficiency Score
-        ax5 = fig.add_subplot(gs[1, 1])
-        efficiency = df.groupby('config')['efficiency'].mean()
-        ax5.bar(range(len(efficiency)), efficiency.values,
-               color=[config_colors[c] for c in efficiency.index])
-        ax5.set_xticks(range(len(efficiency)))
-        ax5.set_xticklabels(efficiency.index, rotation=45, ha='right')
-        ax5.set_ylabel('Network Efficiency (%)')
-        ax5.set_title('Network Efficiency Score')
-        ax5.grid(axis='y', alpha=0.3)
-        ax5.axhline(y=50, color='red', linestyle='--', alpha=0.5, label='Target: 50%')
-        ax5.legend()
-        
-        # 6. Energy Distribution (Box Plot)
-        ax6 = fig.add_subplot(gs[1, 2])
-        data_for_box = [df[df['config'] == config]['total_energy'].values for config in configs]
-        box = ax6.boxplot(data_for_box, labels=configs, patch_artist=True)
-        for patch, config in zip(box['boxes'], configs):
-            patch.set_facecolor(config_colors[config])
-        ax6.set_xticklabels(configs, rotation=45, ha='right')
-        ax6.set_ylabel('Energy (units)')
-        ax6.set_title('Energy Distribution (Box Plot)')
-        ax6.grid(axis='y', alpha=0.3)
-        
-        # 7. Category Performance Heatmap
-        ax7 = fig.add_subplot(gs[2, :])
-        heatmap_data = df.pivot_table(values='total_energy', 
-                                       index='category', 
-                                       columns='config', 
-                                       aggfunc='mean')
-        im = ax7.imshow(heatmap_data.values, cmap='YlOrRd', aspect='auto')
-        ax7.set_xticks(range(len(heatmap_data.columns)))
-        ax7.set_yticks(range(len(heatmap_data.index)))
-        ax7.set_xticklabels(heatmap_data.columns, rotation=45, ha='right')
-        ax7.set_yticklabels(heatmap_data.index)
-        ax7.set_title('Energy Consumption Heatmap: Category vs Configuration')
-        
-        # Add values to heatmap
-        for i in range(len(heatmap_data.index)):
-            for j in range(len(heatmap_data.columns)):
-                text = ax7.text(j, i, f'{heatmap_data.values[i, j]:.0f}',
-                               ha="center", va="center", color="black", fontsize=8)
-        
-        plt.colorbar(im, ax=ax7, label='Energy (units)')
-        
-        plt.suptitle('5G RRC Timer Comparative Study: Static vs. Adaptive', 
-                    fontsize=16, fontweight='bold', y=0.995)
-        
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
-        print(f"\n[OK] Visualization saved to: {output_file}")
-        
-        return fig
-
-
-def main():
+        print(f"\n[OK] All {len(tasks)} plots saved to '{output_dir}/' folder")
+        return output_dir
+
+
+# ===== Plot rendering (module-level so plots can run in worker processes) =====
+
+def _render_plot(task: Tuple) -> str:
+    """Render one plot in a worker process; returns the saved file path"""
+    plot_fn, df, aggregates, output_dir = task
+    plot_path = plot_fn(df, aggregates, output_dir)
+    # Drop the figure's artists now rather than at the worker's next GC cycle
+    gc.collect()
+    return plot_path
+
+
+def _plot_aggregates(df: pd.DataFrame) -> Dict:
+    """
+    Compute the aggregates shared by the plots in one pass each.
+    
+    Returns:
+        Dictionary with:
+            'by_config': per-config means of the plotted metrics
+            'by_category_config': mean energy, categories × configs
+            'config_colors': stable color per configuration
+    """
+    configs = list(df['config'].cat.categories)
+    # Discrete N-color variant of Set3: one row per config, no 256-entry LUT
+    colors = matplotlib.colormaps['Set3'].resampled(len(configs)).colors
+    by_config = df.groupby('config', observed=True, sort=False).agg(
+        total_energy=('total_energy', 'mean'),
+        transitions=('transitions', 'mean'),
+        efficiency=('efficiency', 'mean'),
+        idle_pct=('idle_pct', 'mean'),
+        connected_pct=('connected_pct', 'mean'),
+        inactive_pct=('inactive_pct', 'mean'),
+    )
+    by_category_config = (df.groupby(['category', 'config'], observed=True)['total_energy']
+                          .mean()
+                          .unstack('config'))
+    return {
+        'by_config': by_config,
+        'by_category_config': by_category_config,
+        'config_colors': {config: colors[i] for i, config in enumerate(configs)},
+    }
+
+
+def _save_plot(fig: Figure, output_dir: str, filename: str) -> str:
+    """Lay out and save a figure, then release it immediately"""
+    fig.tight_layout()
+    plot_path = os.path.join(output_dir, filename)
+    fig.savefig(plot_path, dpi=150, bbox_inches='tight')
+    fig.clf()
+    return plot_path
+
+
+def _bar_plot(ax, series: pd.Series, colors: Dict, title: str, ylabel: str, fmt: str = '{:.1f}'):
+    """Per-config bar chart with value labels (shared by plots 1, 3 and 5)"""
+    bars = ax.bar(range(len(series)), series.values,
+                  color=[colors[c] for c in series.index],
+                  edgecolor='black', linewidth=1.5)
+    ax.set_xticks(range(len(series)))
+    ax.set_xticklabels(series.index, rotation=45, ha='right', fontsize=11)
+    ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    ax.bar_label(bars, labels=[fmt.format(v) for v in series.values], fontsize=10, fontweight='bold')
+
+
+def _plot_energy_by_config(df: pd.DataFrame, aggregates: Dict, output_dir: str) -> str:
+    """Plot 1: Energy Consumption by Configuration"""
+    fig1 = Figure(figsize=(10, 6))
+    ax1 = fig1.add_subplot()
+    _bar_plot(ax1, aggregates['by_config']['total_energy'], aggregates['config_colors'],
+              'Energy Consumption by Configuration', 'Average Energy (units)', fmt='{:,.0f}')
+    return _save_plot(fig1, output_dir, '1_energy_by_config.png')
+
+
+def _plot_state_distribution(df: pd.DataFrame, aggregates: Dict, output_dir: str) -> str:
+    """Plot 2: State Distribution (Stacked Bar)"""
+    fig2 = Figure(figsize=(10, 6))
+    ax2 = fig2.add_subplot()
+    state_data = aggregates['by_config'][['idle_pct', 'connected_pct', 'inactive_pct']]
+    state_data.plot(kind='bar', stacked=True, ax=ax2, 
+                   color=['#FF6B6B', '#4ECDC4', '#FFE66D'],
+                   edgecolor='black', linewidth=1.5)
+    ax2.set_ylabel('Time Distribution (%)', fontsize=12, fontweight='bold')
+    ax2.set_title('State Distribution by Configuration', fontsize=14, fontweight='bold', pad=20)
+    ax2.legend(['IDLE', 'CONNECTED', 'INACTIVE'], fontsize=11, loc='upper left')
+    ax2.set_xticklabels(ax2.get_xticklabels(), rotation=45, ha='right', fontsize=11)
+    ax2.set_xlabel('Configuration', fontsize=12, fontweight='bold')
+    ax2.grid(axis='y', alpha=0.3, linestyle='--')
+    
+    return _save_plot(fig2, output_dir, '2_state_distribution.png')
+
+
+def _plot_transition_count(df: pd.DataFrame, aggregates: Dict, output_dir: str) -> str:
+    """Plot 3: Transition Count"""
+    fig3 = Figure(figsize=(10, 6))
+    ax3 = fig3.add_subplot()
+    _bar_plot(ax3, aggregates['by_config']['transitions'], aggregates['config_colors'],
+              'State Transitions by Configuration', 'Average Transitions')
+    return _save_plot(fig3, output_dir, '3_transition_count.png')
+
+
+def _plot_energy_by_category(df: pd.DataFrame, aggregates: Dict, output_dir: str) -> str:
+    """Plot 4: Energy by Category"""
+    config_colors = aggregates['config_colors']
+    by_category_config = aggregates['by_category_config']
+    fig4 = Figure(figsize=(12, 6))
+    ax4 = fig4.add_subplot()
+    for config in by_category_config.columns:
+        category_energy = by_category_config[config].dropna()
+        ax4.plot(category_energy.index.astype(str), category_energy.values, 
+                marker='o', label=config, color=config_colors[config], 
+                linewidth=2.5, markersize=8)
+    ax4.set_ylabel('Average Energy (units)', fontsize=12, fontweight='bold')
+    ax4.set_xlabel('Traffic Category', fontsize=12, fontweight='bold')
+    ax4.set_title('Energy Consumption by Traffic Category', fontsize=14, fontweight='bold', pad=20)
+    ax4.legend(fontsize=10, loc='best')
+    ax4.grid(alpha=0.3, linestyle='--')
+    
+    return _save_plot(fig4, output_dir, '4_energy_by_category.png')
+
+
+def _plot_efficiency_score(df: pd.DataFrame, aggregates: Dict, output_dir: str) -> str:
+    """Plot 5: Efficiency Score"""
+    fig5 = Figure(figsize=(10, 6))
+    ax5 = fig5.add_subplot()
+    _bar_plot(ax5, aggregates['by_config']['efficiency'], aggregates['config_colors'],
+              'Network Efficiency Score', 'Network Efficiency (%)', fmt='{:.1f}%')
+    ax5.axhline(y=50, color='red', linestyle='--', alpha=0.7, linewidth=2, label='Target: 50%')
+    ax5.legend(fontsize=11)
+    return _save_plot(fig5, output_dir, '5_efficiency_score.png')
+
+
+def _plot_energy_boxplot(df: pd.DataFrame, aggregates: Dict, output_dir: str) -> str:
+    """Plot 6: Energy Distribution (Box Plot)"""
+    configs = list(df['config'].cat.categories)
+    config_colors = aggregates['config_colors']
+    fig6 = Figure(figsize=(12, 6))
+    ax6 = fig6.add_subplot()
+    data_for_box = [df[df['config'] == config]['total_energy'].values for config in configs]
+    box = ax6.boxplot(data_for_box, tick_labels=configs, patch_artist=True,
+                     boxprops=dict(linewidth=1.5),
+                     medianprops=dict(color='red', linewidth=2),
+                     whiskerprops=dict(linewidth=1.5),
+                     capprops=dict(linewidth=1.5))
+    
+    for patch, config in zip(box['boxes'], configs):
+        patch.set_facecolor(config_colors[config])
+        patch.set_alpha(0.7)
+    
+    ax6.set_xticklabels(configs, rotation=45, ha='right', fontsize=11)
+    ax6.set_ylabel('Energy (units)', fontsize=12, fontweight='bold')
+    ax6.set_title('Energy Distribution - Box Plot Analysis', fontsize=14, fontweight='bold', pad=20)
+    ax6.grid(axis='y', alpha=0.3, linestyle='--')
+    
+    return _save_plot(fig6, output_dir, '6_energy_distribution_boxplot.png')
+
+
+def _plot_category_heatmap(df: pd.DataFrame, aggregates: Dict, output_dir: str) -> str:
+    """Plot 7: Category Performance Heatmap"""
+    fig7 = Figure(figsize=(12, 6))
+    ax7 = fig7.add_subplot()
+    # Same table as a category × config pivot of mean energy, already computed
+    heatmap_data = aggregates['by_category_config']
+    im = ax7.imshow(heatmap_data.values, cmap='YlOrRd', aspect='auto')
+    ax7.set_xticks(range(len(heatmap_data.columns)))
+    ax7.set_yticks(range(len(heatmap_data.index)))
+    ax7.set_xticklabels(heatmap_data.columns, rotation=45, ha='right', fontsize=11)
+    ax7.set_yticklabels(heatmap_data.index, fontsize=11)
+    ax7.set_title('Energy Consumption Heatmap: Category × Configuration', 
+                 fontsize=14, fontweight='bold', pad=20)
+    
+    # Add values to heatmap
+    for i in range(len(heatmap_data.index)):
+        for j in range(len(heatmap_data.columns)):
+            value = heatmap_data.values[i, j]
+            text = ax7.text(j, i, f'{value:,.0f}',
+                           ha="center", va="center", 
+                           color="white" if value > heatmap_data.values.max()/2 else "black",
+                           fontsize=9, fontweight='bold')
+    
+    cbar = fig7.colorbar(im, ax=ax7, label='Energy (units)')
+    cbar.ax.tick_params(labelsize=10)
+    
+    return _save_plot(fig7, output_dir, '7_heatmap_category_config.png')
+
+
+PLOT_FUNCTIONS = [
+    _plot_energy_by_config,
+    _plot_state_distribution,
+    _plot_transition_count,
+    _plot_energy_by_category,
+    _plot_efficiency_score,
+    _plot_energy_boxplot,
+    _plot_category_heatmap,
+]
+
+
+def main(argv: List[str] = None):
     """
     Main execution function.
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
     """
+    parser = argparse.ArgumentParser(description="5G NR RRC timer comparative study")
+    parser.add_argument('--csv', action='store_true',
+                        help="export raw data as CSV instead of Parquet")
+    parser.add_argument('--cache-dir', default='.cache_rrc',
+                        help="directory for memoized scenario results (default: .cache_rrc)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="simulate every scenario without reading or writing the cache")
+    args = parser.parse_args(argv)
+    
     print("\n")
     print("╔" + "="*68 + "╗")
     print("║" + " "*14 + "5G NR RRC TIMER COMPARATIVE STUDY" + " "*21 + "║")
@@ -627,7 +796,7 @@ def main():
     study = TimerComparativeStudy()
     
     # Run the study
-    study.run_comparative_study()
+    study.run_comparative_study(cache_dir=None if args.no_cache else args.cache_dir)
     
     # Analyze results
     study.analyze_results()
@@ -635,11 +804,9 @@ def main():
     # Generate visualizations
     results_dir = study.plot_results()
     
-    # Export to CSV
-    df = pd.DataFrame(study.results)
-    csv_file = 'comparative_study_data.csv'
-    df.to_csv(csv_file, index=False)
-    print(f"\n[OK] Raw data exported to: {csv_file}")
+    # Export raw data
+    data_file = study.export_results(csv=args.csv)
+    print(f"\n[OK] Raw data exported to: {data_file}")
     
     print("\n" + "="*70)
     print("STUDY COMPLETE")
@@ -653,7 +820,7 @@ def main():
     print(f"  - 5_efficiency_score.png")
     print(f"  - 6_energy_distribution_boxplot.png")
     print(f"  - 7_heatmap_category_config.png")
-    print(f"Data exported to: {csv_file}")
+    print(f"Data exported to: {data_file}")
     print()
 
 
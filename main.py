@@ -1,8 +1,8 @@
 """
 5G NR RRC State Machine - Main Application
 
-Entry point for the 5G RRC simulation with threading integration.
-Orchestrates the simulation engine and GUI in separate threads.
+Entry point for the 5G RRC simulation with multiprocessing integration.
+Orchestrates the simulation engine and GUI in separate processes.
 
 Usage:
     python3 main.py
@@ -12,96 +12,160 @@ Date: 2025-11-27
 """
 
 import tkinter as tk
+import logging
+import multiprocessing as mp
 import threading
+import pickle
 import queue
 import time
 import sys
-from rrc_simulation_engine import RRCSimulationEngine
-from rrc_gui import RRCSimulationGUI
+from rrc_simulation_engine import RRCSimulationEngine, RRCState, StateSnapshot
+from rrc_gui import RRCSimulationGUI, StateMailbox
 
+log = logging.getLogger(__name__)
 
-class RRCApplication:
+
+def configure_logging():
+    """Route log records to stderr as plain messages (no-op if already set up)"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+
+class CommandChannel:
     """
-    Main application class that orchestrates the simulation engine and GUI.
+    Single-producer/single-consumer command channel between processes.
     
-    Architecture:
-    - Simulation runs in background thread at ~1kHz (1ms ticks)
-    - GUI runs in main thread with Tk event loop
-    - Thread-safe communication via queues
+    Exactly one thread sends (the Tk thread) and one receives (the
+    simulation loop), so a one-way pipe needs no locking; unlike
+    multiprocessing.Queue it takes no lock on either end and runs no
+    feeder thread.
     """
     
+    __slots__ = ('_reader', '_writer')
+    
     def __init__(self):
-        """Initialize application components"""
-        # Create simulation engine
-        self.engine = RRCSimulationEngine()
+        self._reader, self._writer = mp.Pipe(duplex=False)
+        
+    def put(self, cmd: dict):
+        """Send a command (GUI side)"""
+        self._writer.send(cmd)
         
-        # Create thread-safe queues
-        self.command_queue = queue.Queue()  # GUI → Engine commands
-        self.state_queue = queue.Queue()    # Engine → GUI state updates
+    def drain(self) -> list:
+        """Receive every pending command, in order (simulation side)"""
+        pending = []
+        reader = self._reader
+        while reader.poll():
+            pending.append(reader.recv())
+        return pending
+
+
+class SimulationLoop:
+    """
+    Simulation engine loop, run in its own process.
+    
+    Runs at approximately 1kHz (1ms per tick), advancing the engine in
+    batches of BATCH_TICKS per wake-up so the Python loop body runs 20
+    times a second rather than 1000.
+    Processes commands from GUI and pushes state updates.
+    
+    All loop state (engine, paused) is owned by the thread
+    calling run(); it only talks to other threads through IPC channels, so
+    nothing here relies on the GIL for atomicity and it is safe on
+    free-threaded (3.13t) builds.
+    """
+    
+    BATCH_TICKS = 50          # Ticks per loop iteration and state push (20Hz for GUI)
+    TICK_NS = 1_000_000       # 1ms tick period
+    
+    def __init__(self, command_channel, state_queue, stop_event):
+        """
+        Initialize the loop.
+        
+        Args:
+            command_channel: CommandChannel carrying commands from the GUI
+            state_queue: Queue for pushing state snapshots to the GUI
+            stop_event: Event set by the GUI process to request shutdown
+        """
+        self.engine = RRCSimulationEngine()
+        self.command_channel = command_channel
+        self.state_queue = state_queue
+        self.stop_event = stop_event
         
-        # Threading control
-        self.running = True
         self.paused = True  # Start paused, wait for user to click Start
-        self.sim_thread = None
         
-        # Statistics
-        self.tick_count = 0
-        self.start_time = time.time()
+    def run(self):
+        """Run until stop_event is set, then hand back the final state"""
+        log.info("Simulation process started")
         
-    def run_simulation_thread(self):
-        """
-        Background thread running the simulation engine.
+        engine = self.engine
+        drain_commands = self.command_channel.drain
         
-        Runs at approximately 1kHz (1ms per tick).
-        Processes commands from GUI and pushes state updates.
-        """
-        print("Simulation thread started")
+        # Absolute deadline pacing: sleeping toward the next deadline
+        # instead of for a fixed interval keeps the rate from drifting
+        next_deadline = time.monotonic_ns()
         
-        last_state_push = 0
-        STATE_PUSH_INTERVAL = 50  # Push state every 50 ticks (20Hz for GUI)
+        batch_ns = self.BATCH_TICKS * self.TICK_NS
         
-        while self.running:
-            loop_start = time.time()
-            
-            # Process all pending commands from GUI
-            while not self.command_queue.empty():
-                try:
-                    cmd = self.command_queue.get_nowait()
+        # Slow-loop warnings are rate limited to one per second
+        slow_batches = 0
+        last_slow_report = 0
+        
+        try:
+            while not self.stop_event.is_set():
+                # Process all pending commands from GUI (they take effect at
+                # the start of the next batch)
+                for cmd in drain_commands():
                     self._process_command(cmd)
-                except queue.Empty:
-                    break
-            
-            # Only tick if not paused
-            if not self.paused:
-                # Tick simulation
-                self.engine.tick()
-                self.tick_count += 1
-            else:
-                # When paused, still push state but don't tick
-                pass
-            
-            # Push state to GUI (throttled to reduce overhead)
-            if self.tick_count - last_state_push >= STATE_PUSH_INTERVAL:
-                state_data = self.engine.get_state()
-                history = self.engine.get_history(last_n_seconds=10.0)
-                state_data['history'] = history
                 
-                # Non-blocking put (drop if queue is full to prevent backlog)
-                try:
-                    self.state_queue.put_nowait(state_data)
-                    last_state_push = self.tick_count
-                except queue.Full:
-                    pass
+                # Only tick (and push) if not paused
+                if not self.paused:
+                    # Advance a whole batch and collect the state to push in
+                    # one call; stretches without transitions go in bulk
+                    state_data = engine.run_ticks_until_push(self.BATCH_TICKS)
                     
-            # Maintain 1kHz tick rate (1ms per loop)
-            elapsed = time.time() - loop_start
-            sleep_time = 0.001 - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            elif elapsed > 0.002:  # Warn if loop is too slow
-                print(f"Warning: Simulation loop slow ({elapsed*1000:.1f}ms)")
-                
-        print("Simulation thread stopped")
+                    # Non-blocking put (drop if queue is full to prevent backlog)
+                    try:
+                        self.state_queue.put_nowait(self._encode(state_data))
+                    except queue.Full:
+                        pass
+                        
+                # Maintain 1kHz tick rate (one batch per BATCH_TICKS ms)
+                next_deadline += batch_ns
+                sleep_ns = next_deadline - time.monotonic_ns()
+                if sleep_ns > 0:
+                    # Sleep on the stop event so shutdown interrupts the wait
+                    self.stop_event.wait(sleep_ns / 1e9)
+                elif sleep_ns < -batch_ns:  # Warn if a whole batch behind
+                    now = time.monotonic_ns()
+                    slow_batches += 1
+                    if now - last_slow_report >= 1_000_000_000:
+                        log.warning("Simulation loop slow (%.1fms behind, %d slow batches)",
+                                    -sleep_ns / 1e6, slow_batches)
+                        slow_batches = 0
+                        last_slow_report = now
+                    # Resync rather than bursting ticks to catch up
+                    next_deadline = now
+        except KeyboardInterrupt:
+            pass
+            
+        # Final snapshot feeds the exit statistics; None marks end of stream
+        try:
+            self.state_queue.put(self._encode(engine.run_ticks_until_push(0)), timeout=2.0)
+            self.state_queue.put(None, timeout=2.0)
+        except queue.Full:
+            pass
+            
+        log.info("Simulation process stopped")
+        
+    @staticmethod
+    def _encode(state_data: StateSnapshot) -> bytes:
+        """
+        Serialize a state snapshot for the GUI.
+        
+        The engine reuses one StateSnapshot, while the queue pickles in a
+        feeder thread later on; serializing here freezes the values before
+        the next batch overwrites them.
+        """
+        return pickle.dumps(state_data, pickle.HIGHEST_PROTOCOL)
         
     def _process_command(self, cmd: dict):
         """
@@ -113,11 +177,11 @@ class RRCApplication:
         command = cmd.get('command')
         
         if command == 'start':
-            print("Simulation STARTED")
+            log.info("Simulation STARTED")
             self.paused = False
             
         elif command == 'stop':
-            print("Simulation PAUSED")
+            log.info("Simulation PAUSED")
             self.paused = True
             
         elif command == 'data_request':
@@ -130,45 +194,125 @@ class RRCApplication:
         elif command == 'set_profile':
             profile = cmd.get('profile', 'IoT')
             self.engine.set_traffic_profile(profile)
-            print(f"Traffic profile changed to: {profile}")
+            log.info("Traffic profile changed to: %s", profile)
             
         elif command == 'reset':
             self.engine.reset()
-            self.tick_count = 0
             
         else:
-            print(f"Unknown command: {command}")
+            log.warning("Unknown command: %s", command)
+
+
+def gil_enabled() -> bool:
+    """Return False when running on a free-threaded CPython build"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+def run_simulation_loop(command_channel, state_queue, stop_event):
+    """Process entry point for the simulation engine"""
+    # Spawned (non-forked) children start with logging unconfigured
+    configure_logging()
+    SimulationLoop(command_channel, state_queue, stop_event).run()
+
+
+class RRCApplication:
+    """
+    Main application class that orchestrates the simulation engine and GUI.
+    
+    Architecture:
+    - Simulation runs in a separate process at ~1kHz (1ms ticks), so the
+      tick loop never competes with the GUI for the GIL
+    - GUI runs in main process with Tk event loop
+    - Commands cross the process boundary on a one-way pipe; state
+      snapshots on a bounded multiprocessing queue, from which a receiver
+      thread forwards them into a single-slot mailbox that keeps only the
+      latest snapshot for the GUI
+    """
+    
+    def __init__(self):
+        """Initialize application components"""
+        # Create inter-process channels
+        self.command_channel = CommandChannel()   # GUI → Engine commands
+        self.state_queue = mp.Queue(maxsize=1)    # Engine → GUI state updates
+        self.state_mailbox = StateMailbox()       # Latest state for the GUI
+        
+        # Process control
+        self.stop_event = mp.Event()
+        self.sim_process = None
+        self.receiver_thread = None
+        
+        # Statistics
+        self.final_state = None
+        self.start_time = time.time()
+        
+    def _receive_states(self):
+        """
+        Background thread forwarding states from the simulation process.
+        
+        Blocks in Queue.get (outside the GIL) between pushes, and exits
+        on the None sentinel sent when the simulation process stops.
+        """
+        while True:
+            payload = self.state_queue.get()
+            if payload is None:
+                break
+            state_data = pickle.loads(payload)
+            self.final_state = state_data
+            self.state_mailbox.put(state_data)
             
+    def _shutdown(self):
+        """Stop the simulation process and the receiver thread"""
+        # The final snapshot must not be pushed into a closing Tk loop
+        self.state_mailbox.on_put = None
+        self.stop_event.set()
+        # Keep the receiver draining until the sentinel, otherwise the
+        # child can block flushing its last snapshot and never exit
+        if self.receiver_thread and self.receiver_thread.is_alive():
+            self.receiver_thread.join(timeout=2.0)
+        if self.sim_process and self.sim_process.is_alive():
+            self.sim_process.join(timeout=2.0)
+            if self.sim_process.is_alive():
+                self.sim_process.terminate()
+                
     def start(self):
         """Start the application"""
         print("="*60)
         print("5G NR RRC State Machine Simulation")
         print("="*60)
+        if not gil_enabled():
+            print("Free-threaded Python detected (GIL disabled)")
         print("Initializing...")
         
+        # Start the simulation process first so it inherits no Tk state
+        self.sim_process = mp.Process(
+            target=run_simulation_loop,
+            args=(self.command_channel, self.state_queue, self.stop_event),
+            daemon=True,
+            name="SimulationProcess"
+        )
+        self.sim_process.start()
+        
+        self.receiver_thread = threading.Thread(
+            target=self._receive_states,
+            daemon=True,
+            name="StateReceiver"
+        )
+        self.receiver_thread.start()
+        
         # Create GUI window
         root = tk.Tk()
         
         # Handle window close
         def on_closing():
             print("\nShutting down...")
-            self.running = False
-            if self.sim_thread and self.sim_thread.is_alive():
-                self.sim_thread.join(timeout=2.0)
+            self._shutdown()
             root.destroy()
             
         root.protocol("WM_DELETE_WINDOW", on_closing)
         
         # Create GUI
-        gui = RRCSimulationGUI(root, self.command_queue, self.state_queue)
-        
-        # Start simulation thread
-        self.sim_thread = threading.Thread(
-            target=self.run_simulation_thread,
-            daemon=True,
-            name="SimulationThread"
-        )
-        self.sim_thread.start()
+        gui = RRCSimulationGUI(root, self.command_channel, self.state_mailbox)
         
         print("Application started successfully!")
         print("\nHow to use:")
@@ -183,36 +327,38 @@ class RRCApplication:
             root.mainloop()
         except KeyboardInterrupt:
             print("\nInterrupted by user")
-            self.running = False
             
         # Cleanup
-        if self.sim_thread and self.sim_thread.is_alive():
-            self.running = False
-            self.sim_thread.join(timeout=2.0)
-            
+        self._shutdown()
+        
+        final_state = self.final_state
+        if final_state is None:
+            print("No state received from simulation process")
+            return
+        tick_count = final_state.tick
+        
         # Print final statistics
         elapsed_time = time.time() - self.start_time
         print("\n" + "="*60)
         print("Simulation Statistics:")
         print(f"  Total runtime: {elapsed_time:.2f}s")
-        print(f"  Total ticks: {self.tick_count:,}")
-        print(f"  Average tick rate: {self.tick_count/elapsed_time:.1f} Hz")
+        print(f"  Total ticks: {tick_count:,}")
+        print(f"  Average tick rate: {tick_count/elapsed_time:.1f} Hz")
         
-        final_state = self.engine.get_state()
         print(f"\n  Final state: {final_state['state_name']}")
         print(f"  Total energy: {final_state['total_energy']:,.0f} units")
         print(f"  State transitions: {final_state['transition_count']}")
         print("\nTime in each state:")
-        for state_val, duration in final_state['state_durations'].items():
-            from rrc_simulation_engine import RRCState
+        for state_val, duration in enumerate(final_state['state_durations']):
             state_name = RRCState(state_val).name
-            percentage = (duration / self.tick_count * 100) if self.tick_count > 0 else 0
+            percentage = (duration / tick_count * 100) if tick_count > 0 else 0
             print(f"  {state_name:12s}: {duration:6d}ms ({percentage:5.1f}%)")
         print("="*60)
 
 
 def main():
     """Main entry point"""
+    configure_logging()
     try:
         app = RRCApplication()
         app.start()
@@ -2,7 +2,8 @@
 5G NR RRC State Machine - Graphical User Interface
 
 Real-time GUI for controlling and visualizing the RRC state machine simulation.
-Built with tkinter and matplotlib for cross-platform compatibility.
+Built with tkinter (charts are drawn on a plain Tk canvas) for cross-platform
+compatibility.
 
 Author: Python port of MATLAB App Designer UI
 Date: 2025-11-27
@@ -10,15 +11,52 @@ Date: 2025-11-27
 
 import tkinter as tk
 from tkinter import ttk, font
-import matplotlib
-matplotlib.use('TkAgg')  # Use Tk backend
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+import numpy as np
 import queue
-from typing import Optional
-from rrc_simulation_engine import RRCState
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+from rrc_simulation_engine import RRCState, StateSnapshot
+
+if TYPE_CHECKING:
+    from main import CommandChannel
+
+# Optional: tkthread lets worker threads push calls into the Tk mainloop
+# (via Tcl thread::send); without it the GUI polls with root.after
+try:
+    from tkthread import TkThread
+    TKTHREAD_AVAILABLE = True
+except ImportError:
+    TKTHREAD_AVAILABLE = False
+
+
+class StateMailbox:
+    """
+    Single-slot exchange for engine → GUI state updates.
+    
+    The GUI only ever needs the newest snapshot, so instead of queueing
+    every update and discarding all but the last, the producer overwrites
+    one slot and the consumer takes (and clears) it. An optional on_put
+    callback is invoked (on the producer's thread) after each put.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = None
+        self.on_put: Optional[Callable[[], None]] = None
+        
+    def put(self, state: StateSnapshot):
+        """Replace the pending snapshot with a newer one"""
+        with self._lock:
+            self._state = state
+        on_put = self.on_put
+        if on_put is not None:
+            on_put()
+            
+    def take(self) -> Optional[StateSnapshot]:
+        """Return the pending snapshot (or None) and clear the slot"""
+        with self._lock:
+            state, self._state = self._state, None
+        return state
 
 
 class RRCSimulationGUI:
@@ -41,24 +79,54 @@ class RRCSimulationGUI:
     }
     
     INACTIVE_COLOR = '#333333'  # Dark gray for inactive lamps
+    GRID_COLOR = '#4D4D4D'      # Strip chart gridlines
+    
+    # Placeholder for snapshots without history (dtypes match the engine's)
+    EMPTY_HISTORY = {
+        'time': np.empty(0, dtype=np.float64),
+        'state': np.empty(0, dtype=np.int8),
+        'data_request': np.empty(0, dtype=np.uint8)
+    }
     
-    def __init__(self, master, command_queue: queue.Queue, state_queue: queue.Queue):
+    # Strip chart layout (pixels) and time axis (seconds)
+    CHART_MARGIN_LEFT = 70
+    CHART_MARGIN_RIGHT = 15
+    CHART_MARGIN_TOP = 10
+    CHART_MARGIN_BOTTOM = 40
+    CHART_GAP = 25
+    CHART_WINDOW_S = 10.0  # Visible span, ending at the newest sample
+    CHART_TICK_S = 2.0
+    
+    def __init__(self, master, command_queue: 'CommandChannel', state_mailbox: StateMailbox):
         """
         Initialize the GUI.
         
         Args:
             master: Tkinter root window
-            command_queue: Queue for sending commands to simulation thread
-            state_queue: Queue for receiving state updates from simulation
+            command_queue: One-way channel for sending commands to the
+                simulation process (anything with put(cmd) works)
+            state_mailbox: Mailbox holding the latest state from simulation
         """
         self.master = master
         self.command_queue = command_queue
-        self.state_queue = state_queue
+        self.state_mailbox = state_mailbox
         
-        # Current state (updated from simulation thread)
+        # Current state (updated from snapshots the simulation process sends)
         self.current_state = RRCState.IDLE
         self.current_state_data = {}
         
+        # Latest history; plots are only redrawn when a new one arrives
+        self.plot_data = None
+        self._plot_dirty = False
+        
+        # State whose lamp is currently lit (None until first update)
+        self._last_active_state = None
+        
+        # Last text rendered into each metric label
+        self._last_time_text = ''
+        self._last_energy_text = ''
+        self._last_trans_text = ''
+        
         # Configure main window
         self.master.title("5G NR RRC State Machine Simulation")
         self.master.geometry("1000x700")
@@ -67,8 +135,21 @@ class RRCSimulationGUI:
         # Create GUI components
         self._create_widgets()
         
-        # Start update loop
-        self._update_loop()
+        # Prefer push delivery from the producer thread; fall back to polling
+        self._tkt = None
+        self._apply_pending = False
+        if TKTHREAD_AVAILABLE:
+            try:
+                self._tkt = TkThread(self.master)
+            except (tk.TclError, RuntimeError):
+                # Tcl built without the Thread package
+                self._tkt = None
+                
+        if self._tkt is not None:
+            self.state_mailbox.on_put = self._schedule_apply
+            self._apply_latest_state()
+        else:
+            self._update_loop()
         
     def _create_widgets(self):
         """Create all GUI widgets"""
@@ -349,86 +430,176 @@ class RRCSimulationGUI:
         self.transition_label.pack(anchor=tk.W, pady=(0, 10))
         
     def _create_charts(self, parent):
-        """Create real-time strip charts using matplotlib"""
+        """Create real-time strip charts drawn directly on a Tk canvas"""
         chart_frame = tk.Frame(parent, bg='#2D2D2D')
         chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create matplotlib figure with dark theme
-        plt.style.use('dark_background')
-        self.fig = Figure(figsize=(8, 6), facecolor='#2D2D2D')
-        
-        # State subplot
-        self.ax_state = self.fig.add_subplot(2, 1, 1)
-        self.ax_state.set_ylabel('RRC State', color='white', fontsize=10)
-        self.ax_state.set_ylim(-0.5, 2.5)
-        self.ax_state.set_yticks([0, 1, 2])
-        self.ax_state.set_yticklabels(['IDLE', 'CONN', 'INACT'], fontsize=8)
-        self.ax_state.grid(True, alpha=0.3)
-        self.ax_state.set_facecolor('#1E1E1E')
-        
-        # Data request subplot
-        self.ax_data = self.fig.add_subplot(2, 1, 2)
-        self.ax_data.set_ylabel('Data Active', color='white', fontsize=10)
-        self.ax_data.set_xlabel('Time (s)', color='white', fontsize=10)
-        self.ax_data.set_ylim(-0.1, 1.1)
-        self.ax_data.set_yticks([0, 1])
-        self.ax_data.grid(True, alpha=0.3)
-        self.ax_data.set_facecolor('#1E1E1E')
-        
-        self.fig.tight_layout()
-        
-        # Initialize plot lines
-        self.line_state, = self.ax_state.plot([], [], 'g-', linewidth=2, label='State')
-        self.line_data, = self.ax_data.plot([], [], 'c-', linewidth=2, label='Data')
-        
-        # Embed in tkinter
-        self.canvas = FigureCanvasTkAgg(self.fig, master=chart_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Start animation
-        self.ani = FuncAnimation(
-            self.fig,
-            self._update_plots,
-            interval=50,  # Update every 50ms (20 FPS)
-            blit=False
+        self.chart_canvas = tk.Canvas(
+            chart_frame,
+            bg='#2D2D2D',
+            width=800,
+            height=600,
+            highlightthickness=0
         )
-        
-    def _update_plots(self, frame):
-        """Update plot data (called by FuncAnimation)"""
-        if not hasattr(self, 'plot_data'):
+        self.chart_canvas.pack(fill=tk.BOTH, expand=True)
+        
+        # Panels: (key, y-axis label, y range, y ticks)
+        self._chart_panels = [
+            ('state', 'RRC State', (-0.5, 2.5), [(0, 'IDLE'), (1, 'CONN'), (2, 'INACT')]),
+            ('data', 'Data Active', (-0.1, 1.1), [(0, '0'), (1, '1')]),
+        ]
+        # Pixel rectangle and y range per panel, filled in by _layout_charts
+        self._panel_rects = {}
+        
+        # Time axis is fixed relative to the newest sample (0 = now)
+        self._xlim = (-self.CHART_WINDOW_S, 0.0)
+        
+        # Plot lines: each frame replaces a line's points with one coords() call
+        self.line_state = self.chart_canvas.create_line(0, 0, 0, 0, fill='#00C000', width=2)
+        self.line_data = self.chart_canvas.create_line(0, 0, 0, 0, fill='#00BFBF', width=2)
+        
+        # Static items (backgrounds, grid, labels) are redrawn only on resize
+        self.chart_canvas.bind('<Configure>', self._on_chart_resize)
+        
+    def _on_chart_resize(self, event):
+        """Re-layout the charts for the new canvas size and redraw the lines"""
+        self._layout_charts(event.width, event.height)
+        if self.plot_data is not None:
+            self._plot_dirty = True
+        self._update_plots()
+        
+    def _layout_charts(self, width: int, height: int):
+        """Draw panel backgrounds, horizontal grid and y labels"""
+        canvas = self.chart_canvas
+        canvas.delete('static')
+        
+        x0 = self.CHART_MARGIN_LEFT
+        x1 = max(x0 + 1, width - self.CHART_MARGIN_RIGHT)
+        panel_height = max(1, (height - self.CHART_MARGIN_TOP - self.CHART_MARGIN_BOTTOM - self.CHART_GAP) // 2)
+        
+        for i, (key, label, (vmin, vmax), ticks) in enumerate(self._chart_panels):
+            y0 = self.CHART_MARGIN_TOP + i * (panel_height + self.CHART_GAP)
+            y1 = y0 + panel_height
+            self._panel_rects[key] = (x0, y0, x1, y1, vmin, vmax)
+            
+            canvas.create_rectangle(x0, y0, x1, y1, fill='#1E1E1E', outline='#888888', tags='static')
+            for value, text in ticks:
+                y = y1 - (value - vmin) * (y1 - y0) / (vmax - vmin)
+                canvas.create_line(x0, y, x1, y, fill=self.GRID_COLOR, tags='static')
+                canvas.create_text(x0 - 5, y, text=text, fill='white', font=('Arial', 8),
+                                   anchor=tk.E, tags='static')
+            canvas.create_text(15, (y0 + y1) / 2, text=label, fill='white', font=('Arial', 10),
+                               angle=90, tags='static')
+            
+        canvas.create_text((x0 + x1) / 2, height - 10, text='Time relative to now (s)',
+                           fill='white', font=('Arial', 10), tags='static')
+        
+        # Time gridlines never move: the data is shifted instead
+        xmin, xmax = self._xlim
+        for t in np.arange(xmin, xmax + 1e-9, self.CHART_TICK_S):
+            for key, (x0, y0, x1, y1, _, _) in self._panel_rects.items():
+                x = x0 + (t - xmin) * (x1 - x0) / (xmax - xmin)
+                canvas.create_line(x, y0, x, y1, fill=self.GRID_COLOR, tags='static')
+                if key == 'data':
+                    canvas.create_text(x, y1 + 10, text=f"{t:g}", fill='white',
+                                       font=('Arial', 8), tags='static')
+        canvas.tag_lower('static')
+        
+    def _update_plots(self):
+        """Redraw the strip chart lines if a new history has arrived"""
+        if not self._plot_dirty or not self._panel_rects:
             return
+        self._plot_dirty = False
             
         data = self.plot_data
-        if not data['time']:
+        times = np.asarray(data['time'], dtype=np.float64)
+        if len(times) == 0:
             return
             
-        # Update state line
-        self.line_state.set_data(data['time'], data['state'])
-        
-        # Update data request line
-        self.line_data.set_data(data['time'], data['data_request'])
-        
-        # Auto-scale x-axis to show last 10 seconds
-        if data['time']:
-            max_time = max(data['time'])
-            min_time = max(0, max_time - 10)
-            self.ax_state.set_xlim(min_time, max_time + 0.1)
-            self.ax_data.set_xlim(min_time, max_time + 0.1)
+        # Show the last 10 seconds on the static axis by shifting the
+        # samples so the newest lands at 0
+        times = times - times[-1]
+        
+        # Times are sorted: binary search for the first visible sample so
+        # a longer history is not mapped and downsampled off-panel
+        first = int(np.searchsorted(times, self._xlim[0], side='left'))
+        times = times[first:]
+            
+        self._set_line(self.line_state, 'state', times, data['state'][first:])
+        self._set_line(self.line_data, 'data', times, data['data_request'][first:])
+        
+    def _set_line(self, line_id: int, panel: str, times: np.ndarray, values):
+        """Map samples to pixels and replace the line's points"""
+        x0, y0, x1, y1, vmin, vmax = self._panel_rects[panel]
+        xmin, xmax = self._xlim
+        
+        xs = x0 + (times - xmin) * ((x1 - x0) / (xmax - xmin))
+        ys = y1 - (np.asarray(values, dtype=np.float64) - vmin) * ((y1 - y0) / (vmax - vmin))
+        xs, ys = self._downsample(xs, ys, int(x1 - x0))
+        if len(xs) == 1:
+            # A canvas line needs at least two points
+            xs = np.repeat(xs, 2)
+            ys = np.repeat(ys, 2)
+            
+        coords = np.empty(2 * len(xs))
+        coords[0::2] = xs
+        coords[1::2] = ys
+        self.chart_canvas.coords(line_id, coords.tolist())
+        
+    @staticmethod
+    def _downsample(xs: np.ndarray, ys: np.ndarray, columns: int):
+        """
+        Reduce a line to about two points per pixel column.
+        
+        Samples are grouped into buckets of equal size, one per column,
+        and each bucket is replaced by its min and max (ordered by the
+        bucket's direction). Short pulses and transitions that stride
+        slicing would skip stay visible.
+        """
+        n = len(xs)
+        stride = -(-n // max(1, columns))
+        if stride <= 2:
+            return xs, ys
             
-        return self.line_state, self.line_data
+        # Pad the last partial bucket with its final sample
+        pad = -n % stride
+        if pad:
+            xs = np.concatenate((xs, np.full(pad, xs[-1])))
+            ys = np.concatenate((ys, np.full(pad, ys[-1])))
+        buckets = ys.reshape(-1, stride)
+        
+        lo = buckets.min(axis=1)
+        hi = buckets.max(axis=1)
+        rising = buckets[:, -1] >= buckets[:, 0]
+        out_y = np.column_stack((np.where(rising, lo, hi), np.where(rising, hi, lo))).ravel()
+        out_x = np.repeat(xs.reshape(-1, stride)[:, 0], 2)
+        return out_x, out_y
         
     def _update_loop(self):
-        """Main update loop - polls state from simulation thread"""
-        # Get latest state from queue (non-blocking)
-        try:
-            while True:
-                state_data = self.state_queue.get_nowait()
-                self.current_state = RRCState(state_data['state'])
-                self.current_state_data = state_data
-                self.plot_data = state_data.get('history', {'time': [], 'state': [], 'data_request': []})
-        except queue.Empty:
-            pass
+        """Polling update loop, used when tkthread is unavailable"""
+        self._apply_latest_state()
+        
+        # Schedule next update (50ms = 20Hz)
+        self.master.after(50, self._update_loop)
+        
+    def _schedule_apply(self):
+        """Queue _apply_latest_state on the Tk thread (safe from any thread)"""
+        # Coalesce: one pending call picks up whatever is newest
+        if not self._apply_pending:
+            self._apply_pending = True
+            self._tkt.nosync(self._apply_latest_state)
+            
+    def _apply_latest_state(self):
+        """Apply the newest mailbox state to indicators and metrics"""
+        self._apply_pending = False
+        
+        # Take latest state from mailbox (non-blocking)
+        state_data = self.state_mailbox.take()
+        if state_data is not None:
+            self.current_state = RRCState(state_data['state'])
+            self.current_state_data = state_data
+            self.plot_data = state_data.get('history') or self.EMPTY_HISTORY
+            self._plot_dirty = True
             
         # Update state indicators
         self._update_state_lamps()
@@ -436,33 +607,47 @@ class RRCSimulationGUI:
         # Update metrics
         self._update_metrics()
         
-        # Schedule next update (50ms = 20Hz)
-        self.master.after(50, self._update_loop)
+        # Redraw strip chart (no-op unless new history arrived)
+        self._update_plots()
         
     def _update_state_lamps(self):
         """Update visual state indicator lamps"""
-        for state, lamp_id in self.lamp_ids.items():
-            if state == self.current_state:
-                # Active state - bright color
-                self.lamp_canvas.itemconfig(lamp_id, fill=self.STATE_COLORS[state])
-            else:
-                # Inactive state - dark
-                self.lamp_canvas.itemconfig(lamp_id, fill=self.INACTIVE_COLOR)
+        # Only touch the canvas on a state change: dim the old lamp and
+        # light the new one
+        if self.current_state == self._last_active_state:
+            return
+            
+        if self._last_active_state is not None:
+            # Inactive state - dark
+            self.lamp_canvas.itemconfig(self.lamp_ids[self._last_active_state], fill=self.INACTIVE_COLOR)
+        # Active state - bright color
+        self.lamp_canvas.itemconfig(self.lamp_ids[self.current_state], fill=self.STATE_COLORS[self.current_state])
+        self._last_active_state = self.current_state
                 
     def _update_metrics(self):
         """Update metrics display"""
         if self.current_state_data:
+            # Labels are only reconfigured when their text changes
             # Simulation time
             sim_time = self.current_state_data.get('simulation_time', 0)
-            self.time_label.config(text=f"{sim_time:.2f} s")
+            text = f"{sim_time:.2f} s"
+            if text != self._last_time_text:
+                self.time_label.config(text=text)
+                self._last_time_text = text
             
             # Total energy
             energy = self.current_state_data.get('total_energy', 0)
-            self.energy_label.config(text=f"{int(energy):,} units")
+            text = f"{int(energy):,} units"
+            if text != self._last_energy_text:
+                self.energy_label.config(text=text)
+                self._last_energy_text = text
             
             # Transitions
             transitions = self.current_state_data.get('transition_count', 0)
-            self.transition_label.config(text=str(transitions))
+            text = str(transitions)
+            if text != self._last_trans_text:
+                self.transition_label.config(text=text)
+                self._last_trans_text = text
             
     # === Event handlers ===
     
@@ -531,14 +716,13 @@ class RRCSimulationGUI:
 
 # Test GUI standalone (with mock data)
 if __name__ == "__main__":
-    import threading
     import time
     
     print("Testing GUI with mock simulation data...")
     
-    # Create queues
+    # Create command queue and state mailbox
     cmd_queue = queue.Queue()
-    state_queue = queue.Queue()
+    state_mailbox = StateMailbox()
     
     # Mock simulation thread
     def mock_simulation():
@@ -552,22 +736,22 @@ if __name__ == "__main__":
                 
             mock_energy += [1, 100, 10][mock_state]
             
-            # Generate mock history
+            # Generate mock history (same array types as the engine's)
             history = {
-                'time': [mock_time - i*0.1 for i in range(100)],
-                'state': [mock_state] * 100,
-                'data_request': [1 if i % 20 < 5 else 0 for i in range(100)]
+                'time': mock_time - np.arange(99, -1, -1) * 0.1,
+                'state': np.full(100, mock_state, dtype=np.int8),
+                'data_request': (np.arange(100) % 20 < 5).astype(np.uint8)
             }
             
             # Push state
-            state_queue.put({
-                'state': mock_state,
-                'state_name': ['IDLE', 'CONNECTED', 'INACTIVE'][mock_state],
-                'simulation_time': mock_time,
-                'total_energy': mock_energy,
-                'transition_count': int(mock_time / 2),
-                'history': history
-            })
+            snapshot = StateSnapshot()
+            snapshot.state = mock_state
+            snapshot.state_name = ['IDLE', 'CONNECTED', 'INACTIVE'][mock_state]
+            snapshot.simulation_time = mock_time
+            snapshot.total_energy = mock_energy
+            snapshot.transition_count = int(mock_time / 2)
+            snapshot.history = history
+            state_mailbox.put(snapshot)
             
             mock_time += 0.05
             time.sleep(0.05)
@@ -578,7 +762,7 @@ if __name__ == "__main__":
     
     # Create GUI
     root = tk.Tk()
-    gui = RRCSimulationGUI(root, cmd_queue, state_queue)
+    gui = RRCSimulationGUI(root, cmd_queue, state_mailbox)
     
     # Print commands from GUI
     def print_commands():
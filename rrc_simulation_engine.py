@@ -13,9 +13,33 @@ Author: Python port of MATLAB Simulink model
 Date: 2025-11-27
 """
 
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from enum import IntEnum
-from typing import Dict, List, Tuple
-import time
+import itertools
+import os
+import sys
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:  # NumPy is optional - history then lives in array.array buffers
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional - the kernels below then run as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 
 class RRCState(IntEnum):
@@ -31,6 +55,76 @@ class TrafficProfile(IntEnum):
     IOT = 1        # Short bursts, frequent sleep
 
 
+# Model constants as tuples indexed by enum value, so hot-path lookups are
+# a global load plus a small-int subscript instead of a dict hash. The
+# engine's class-level dicts are views of these for enum-keyed access.
+
+# Power consumption per state (arbitrary units per tick): IDLE, CONNECTED, INACTIVE
+POWER_BY_STATE = (0, 100, 10)
+
+# Adaptive CONNECTED -> INACTIVE thresholds (ticks): STREAMING, IOT
+INACTIVITY_TH = (10000, 200)
+
+# INACTIVE -> IDLE thresholds (ticks): STREAMING, IOT
+# Note: 3GPP RNA update timer is typically 30s, using shorter times for demonstration
+LONG_INACTIVITY_TH = (20000, 5000)
+
+
+class StateSnapshot:
+    """
+    Simulation state snapshot returned by RRCSimulationEngine.get_state().
+    
+    Each engine owns one instance and refreshes it in place on every
+    get_state() call instead of allocating a new dict. Fields are plain
+    attributes; the item-style reads of the former dict result
+    (snapshot['state'], 'state' in snapshot, snapshot.get(...)) still work.
+    state_durations is a tuple of ticks per state, indexed by state value
+    (an RRCState works as the index).
+    """
+    
+    __slots__ = (
+        'state', 'state_name', 'tick', 'simulation_time', 'total_energy',
+        'inactivity_timer', 'long_inactivity_timer',
+        'inactivity_threshold', 'long_inactivity_threshold',
+        'traffic_profile', 'data_active', 'transition_count',
+        'state_durations', 'history',
+    )
+    
+    def __init__(self):
+        # history is attached by consumers that ship snapshots to the GUI
+        self.history = None
+        
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+            
+    def __setitem__(self, key: str, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+        
+    def __contains__(self, key) -> bool:
+        return key in self.__slots__ and hasattr(self, key)
+        
+    def get(self, key: str, default=None):
+        """Dict-style read with default"""
+        return getattr(self, key, default) if key in self.__slots__ else default
+        
+    def asdict(self) -> Dict:
+        """Copy of the snapshot as a plain dictionary"""
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+        
+    def __eq__(self, other):
+        if isinstance(other, StateSnapshot):
+            return self.asdict() == other.asdict()
+        return NotImplemented
+        
+    def __repr__(self):
+        return f"StateSnapshot({self.asdict()!r})"
+
+
 class RRCSimulationEngine:
     """
     Discrete-event simulation engine for 5G NR RRC state machine.
@@ -39,30 +133,37 @@ class RRCSimulationEngine:
     Implements 3GPP-compliant state transitions with adaptive inactivity timer.
     """
     
-    # Power consumption per state (arbitrary units per tick)
-    POWER_CONSUMPTION = {
-        RRCState.IDLE: 0,        # No power consumption when fully asleep
-        RRCState.CONNECTED: 100,
-        RRCState.INACTIVE: 10
-    }
+    # Fixed attribute set: slot descriptors instead of a per-instance
+    # __dict__ for the attributes tick() reads and writes every step.
+    # state, traffic_profile and state_durations are properties below.
+    __slots__ = (
+        '_state', 'previous_state',
+        'inactivity_timer', 'long_inactivity_timer', 'simulation_time',
+        '_traffic_profile', 'inactivity_threshold', 'long_inactivity_threshold',
+        'data_request', 'paging_request', 'data_active', 'data_burst_duration',
+        'total_energy',
+        'max_history_length', 'packed_history',
+        'hist_head', 'hist_count',
+        'event_log', 'log_enabled',
+        '_state_dur', 'transition_count', '_snapshot',
+    )
     
-    # Adaptive timer thresholds (in milliseconds/ticks)
-    TIMER_THRESHOLDS = {
-        TrafficProfile.STREAMING: 10000,  # 10 seconds
-        TrafficProfile.IOT: 200           # 200 milliseconds
-    }
+    # Power consumption per state (arbitrary units per tick); IDLE draws
+    # nothing when fully asleep
+    POWER_CONSUMPTION = dict(zip(RRCState, POWER_BY_STATE))
+    POWER_BY_STATE = POWER_BY_STATE
     
-    # Long inactivity timer for INACTIVE -> IDLE (profile-dependent)
-    # Note: 3GPP RNA update timer is typically 30s, using shorter times for demonstration
-    LONG_INACTIVITY_THRESHOLDS = {
-        TrafficProfile.STREAMING: 20000,  # 20 seconds (longer for streaming sessions)
-        TrafficProfile.IOT: 5000          # 5 seconds (shorter for IoT bursts)
-    }
+    # Adaptive timer thresholds (in milliseconds/ticks): 10s streaming, 200ms IoT
+    TIMER_THRESHOLDS = dict(zip(TrafficProfile, INACTIVITY_TH))
+    
+    # Long inactivity timer for INACTIVE -> IDLE (profile-dependent): 20s
+    # for streaming sessions, 5s for IoT bursts
+    LONG_INACTIVITY_THRESHOLDS = dict(zip(TrafficProfile, LONG_INACTIVITY_TH))
     
     def __init__(self):
         """Initialize the RRC simulation engine"""
-        # State machine
-        self.state = RRCState.IDLE
+        # State machine (state held as a plain int; see the state property)
+        self._state = int(RRCState.IDLE)
         self.previous_state = RRCState.IDLE
         
         # Timers (in ticks, 1 tick = 1ms)
@@ -70,10 +171,11 @@ class RRCSimulationEngine:
         self.long_inactivity_timer = 0
         self.simulation_time = 0  # Total elapsed time in ms
         
-        # Traffic profile and adaptive thresholds
-        self.traffic_profile = TrafficProfile.IOT
-        self.inactivity_threshold = self.TIMER_THRESHOLDS[TrafficProfile.IOT]
-        self.long_inactivity_threshold = self.LONG_INACTIVITY_THRESHOLDS[TrafficProfile.IOT]
+        # Traffic profile (plain int; see the traffic_profile property) and
+        # adaptive thresholds
+        self._traffic_profile = int(TrafficProfile.IOT)
+        self.inactivity_threshold = INACTIVITY_TH[self._traffic_profile]
+        self.long_inactivity_threshold = LONG_INACTIVITY_TH[self._traffic_profile]
         
         # Event flags
         self.data_request = False
@@ -84,23 +186,37 @@ class RRCSimulationEngine:
         # Energy tracking
         self.total_energy = 0.0
         
-        # History for visualization (ring buffer to prevent unbounded growth)
+        # History for visualization: a fixed-size ring buffer of one byte
+        # per tick, packing the state into the low two bits and the data
+        # flag into bit 4 (see _STATE_MASK/_DATA_SHIFT); get_history()
+        # unpacks it. hist_head is the next write slot, hist_count the
+        # number of valid samples. One sample is written per tick, so the
+        # buffer always holds the ticks just before simulation_time and
+        # sample times are derived from that instead of being stored.
         self.max_history_length = 100000  # 100 seconds at 1kHz
-        self.state_history: List[int] = []
-        self.data_request_history: List[int] = []
-        self.time_history: List[float] = []
-        
-        # Event log
-        self.event_log: List[Tuple[float, str]] = []
-        
-        # Statistics
-        self.state_durations = {
-            RRCState.IDLE: 0,
-            RRCState.CONNECTED: 0,
-            RRCState.INACTIVE: 0
-        }
+        if NUMPY_AVAILABLE:
+            self.packed_history = np.zeros(self.max_history_length, dtype=np.uint8)
+        else:
+            self.packed_history = array('B', bytes(self.max_history_length))
+        self.hist_head = 0
+        self.hist_count = 0
+        
+        # Event log of (tick, event): appends past the cap evict the
+        # oldest entry; tick * 1e-3 gives seconds. Transitions and triggers
+        # are logged as (event code, value) pairs and only turned into text
+        # by format_events(); other events are plain messages. With
+        # log_enabled off nothing is logged.
+        self.event_log: Deque[Tuple[int, Union[str, Tuple[int, int]]]] = deque(maxlen=1000)  # Last 1000 events
+        self.log_enabled = True
+        
+        # Statistics: ticks spent per state, indexed by state value (see
+        # the state_durations property for the dict view)
+        self._state_dur = [0, 0, 0]
         self.transition_count = 0
         
+        # Reused by get_state()
+        self._snapshot = StateSnapshot()
+        
     def tick(self):
         """
         Main simulation step - called every 1ms.
@@ -112,20 +228,70 @@ class RRCSimulationEngine:
         4. Record history
         5. Increment simulation time
         """
-        # Update inactivity timers
-        self._update_timers()
-        
-        # Process state machine logic
-        self._update_state_machine()
-        
-        # Calculate energy consumption
-        self._calculate_energy()
-        
-        # Update statistics
-        self.state_durations[self.state] += 1
+        # Engine fields are read into locals once and written back once;
+        # this is _step() inlined for the interpreted per-tick path
+        state = self._state
+        data_request = self.data_request
+        inactivity_timer = self.inactivity_timer
+        long_inactivity_timer = self.long_inactivity_timer
+        data_burst_duration = self.data_burst_duration
+        
+        # Inactivity timer (for CONNECTED -> INACTIVE): reset while data is
+        # active or in other states
+        if state == _CONNECTED and not self.data_active:
+            inactivity_timer += 1
+        else:
+            inactivity_timer = 0
+            
+        # Long inactivity timer (for INACTIVE -> IDLE)
+        if state == _INACTIVE:
+            long_inactivity_timer += 1
+        else:
+            long_inactivity_timer = 0
+            
+        # Data burst duration countdown
+        data_active = data_burst_duration > 0
+        if data_active:
+            data_burst_duration -= 1
+            
+        # Process state machine logic (see _next_state). The thresholds stay
+        # attribute reads rather than per-profile literals: callers may
+        # override them after set_traffic_profile(), and specialized copies
+        # measured no faster.
+        new_state = _NEXT_STATE[state * 32 + data_request * 16 + self.paging_request * 8
+                                + (inactivity_timer >= self.inactivity_threshold) * 4
+                                + (long_inactivity_timer >= self.long_inactivity_threshold) * 2
+                                + data_active]
+        
+        self.inactivity_timer = inactivity_timer
+        self.long_inactivity_timer = long_inactivity_timer
+        self.data_burst_duration = data_burst_duration
+        self.data_active = data_active
+        # Clear data request flag after processing
+        self.data_request = False
         
-        # Record history (with ring buffer management)
-        self._record_history()
+        # Track state changes
+        if new_state != state:
+            self._state = new_state
+            self.previous_state = _STATES[state]
+            self.transition_count += 1
+            if self.log_enabled:
+                self.event_log.append((self.simulation_time, self._transition_event(
+                    state, new_state, data_request, inactivity_timer, long_inactivity_timer)))
+            
+        # Calculate energy consumption and update statistics
+        self.total_energy += _POWER[new_state]
+        self._state_dur[new_state] += 1
+        
+        # Record history, overwriting the oldest ring buffer slot
+        head = self.hist_head
+        self.packed_history[head] = new_state | data_active << _DATA_SHIFT
+        head += 1
+        if head == self.max_history_length:
+            head = 0
+        self.hist_head = head
+        if self.hist_count < self.max_history_length:
+            self.hist_count += 1
         
         # Increment simulation time
         self.simulation_time += 1
@@ -133,112 +299,307 @@ class RRCSimulationEngine:
         # Clear single-tick events
         self.paging_request = False
         
-    def _update_timers(self):
-        """Update all timer counters"""
-        # Inactivity timer (for CONNECTED -> INACTIVE)
-        if self.state == RRCState.CONNECTED:
-            if self.data_active:
-                # Reset timer when data is active
-                self.inactivity_timer = 0
+    def tick_n(self, n: int):
+        """
+        Advance the simulation by n ticks with no new external events.
+        
+        Equivalent to calling tick() n times, but stretches where the state
+        machine evolves only by timer counting (idle, steady data burst,
+        timer run-up to expiry) are applied in a single bulk step; only the
+        ticks where something changes go through tick().
+        
+        Args:
+            n: Number of 1ms ticks to advance
+        """
+        # Bind hot methods once; the loop may run per-tick near transitions
+        tick = self.tick
+        quiet_ticks = self._quiet_ticks
+        advance_quiet = self._advance_quiet
+        while n > 0:
+            k = 0
+            if not (self.data_request or self.paging_request):
+                k = quiet_ticks(n)
+            if k > 0:
+                advance_quiet(k)
+                n -= k
             else:
-                # Increment when no data activity
-                self.inactivity_timer += 1
-        else:
-            # Reset in other states
-            self.inactivity_timer = 0
+                tick()
+                n -= 1
+                
+    def run(self, n_ticks: int, data_events=None):
+        """
+        Advance n_ticks, triggering scheduled data bursts along the way.
+        
+        Batch replacement for a Python loop that calls tick() and, at
+        scheduled ticks, trigger_data_request(); the whole run is one
+        run_vectorized() call.
+        
+        Args:
+            n_ticks: Number of 1ms ticks to advance
+            data_events: (tick, burst_ms) pairs, ticks relative to the current tick
+        """
+        schedule = [] if data_events is None else list(data_events)
+        self.run_vectorized(n_ticks, [tick for tick, _ in schedule],
+                            [burst for _, burst in schedule])
+        
+    def run_vectorized(self, n_ticks: int, data_request_ticks, data_burst_durations,
+                       paging_ticks=()):
+        """
+        Advance n_ticks with a prescheduled set of external events.
+        
+        Equivalent to calling trigger_data_request()/trigger_paging() at
+        the scheduled ticks and tick() once per tick, but the schedule is
+        sorted up front and the whole horizon runs in the compiled
+        _run_kernel() when Numba is available. Without Numba the run jumps
+        from event to event with advance_to_next_event(), so timer run-ups
+        cost O(1) instead of one tick each.
+        
+        Args:
+            n_ticks: Number of 1ms ticks to advance
+            data_request_ticks: Data request ticks, relative to the current tick
+            data_burst_durations: Burst duration (ms) per data request
+            paging_ticks: Paging ticks, relative to the current tick
+        """
+        if len(data_request_ticks) != len(data_burst_durations):
+            raise ValueError("data_request_ticks and data_burst_durations differ in length")
             
-        # Long inactivity timer (for INACTIVE -> IDLE)
-        if self.state == RRCState.INACTIVE:
-            self.long_inactivity_timer += 1
-        else:
-            self.long_inactivity_timer = 0
+        if NUMBA_AVAILABLE:
+            data_ticks = np.asarray(data_request_ticks, dtype=np.int64)
+            bursts = np.asarray(data_burst_durations, dtype=np.int64)
+            pages = np.sort(np.asarray(paging_ticks, dtype=np.int64))
+            # Stable sort: a later request at the same tick still wins
+            order = np.argsort(data_ticks, kind='stable')
+            data_ticks = data_ticks[order]
+            bursts = bursts[order]
+            # Events at or past the horizon never fire
+            n_data = int(np.searchsorted(data_ticks, n_ticks))
+            data_ticks, bursts = data_ticks[:n_data], bursts[:n_data]
+            pages = pages[:int(np.searchsorted(pages, n_ticks))]
+            self._run_compiled(n_ticks, data_ticks, bursts, pages)
+            return
             
-        # Data burst duration countdown
-        if self.data_burst_duration > 0:
-            self.data_burst_duration -= 1
-            self.data_active = True
-        else:
-            self.data_active = False
+        # Absolute-tick event queue; at a shared tick data requests go first
+        # (the sort is stable, so a later request at the same tick still wins).
+        # Events at or past the horizon never fire.
+        start = self.simulation_time
+        events = [(start + int(t), int(burst))
+                  for t, burst in zip(data_request_ticks, data_burst_durations) if t < n_ticks]
+        events += [(start + int(t), None) for t in paging_ticks if t < n_ticks]
+        events.sort(key=lambda event: (event[0], event[1] is None))
+        events = deque(events)
+        
+        end = start + n_ticks
+        advance = self.advance_to_next_event
+        while self.simulation_time < end:
+            advance(events, until=end)
             
-    def _update_state_machine(self):
+    def advance_to_next_event(self, external_events: Optional[Deque] = None,
+                              until: Optional[int] = None) -> int:
         """
-        Implement 3GPP TS 38.331 state transition logic.
-        
-        Transition diagram:
-                    data_request
-            IDLE -----------------> CONNECTED
-             ^                          |
-             |                          | inactivity_timer > threshold
-             |                          v
-             |                     INACTIVE
-             |                          |
-             +<-------------------------+
-                 long_inactivity_timer > threshold
-                 
-        Fast resume: INACTIVE --data_request--> CONNECTED
+        Jump straight to the next tick where something happens and run it.
+        
+        Fires the external events that are due, then applies the quiet
+        ticks up to the next change (burst end, timer expiry, the next
+        external event or until) in one bulk step (see _quiet_ticks) and
+        runs that tick through tick().
+        
+        Args:
+            external_events: deque of (tick, burst_ms) events in absolute
+                ticks, sorted by tick; burst_ms None schedules paging. Fired
+                events are popped from the left.
+            until: Absolute tick not to advance past
+            
+        Returns:
+            Number of ticks advanced; 0 at until, or in IDLE with nothing
+            scheduled
         """
-        old_state = self.state
-        
-        # === IDLE State Transitions ===
-        if self.state == RRCState.IDLE:
-            # IDLE -> CONNECTED: On data request or paging
-            if self.data_request or self.paging_request:
-                self.state = RRCState.CONNECTED
-                self._log_event(f"Transition: IDLE -> CONNECTED (trigger: {'data' if self.data_request else 'paging'})")
-                
-        # === CONNECTED State Transitions ===
-        elif self.state == RRCState.CONNECTED:
-            # CONNECTED -> INACTIVE: On inactivity timer expiry
-            if self.inactivity_timer >= self.inactivity_threshold and not self.data_active:
-                self.state = RRCState.INACTIVE
-                self._log_event(f"Transition: CONNECTED -> INACTIVE (inactivity: {self.inactivity_timer}ms)")
-                
-        # === INACTIVE State Transitions ===
-        elif self.state == RRCState.INACTIVE:
-            # INACTIVE -> CONNECTED: Fast resume on data request
-            if self.data_request:
-                self.state = RRCState.CONNECTED
-                self._log_event("Transition: INACTIVE -> CONNECTED (fast resume)")
-                
-            # INACTIVE -> IDLE: On long inactivity timer expiry
-            elif self.long_inactivity_timer >= self.long_inactivity_threshold:
-                self.state = RRCState.IDLE
-                self._log_event(f"Transition: INACTIVE -> IDLE (long inactivity: {self.long_inactivity_timer}ms)")
+        now = self.simulation_time
+        while external_events and external_events[0][0] <= now:
+            burst_ms = external_events.popleft()[1]
+            if burst_ms is None:
+                self.trigger_paging()
+            else:
+                self.trigger_data_request(burst_ms)
                 
-        # Track state changes
-        if old_state != self.state:
-            self.previous_state = old_state
-            self.transition_count += 1
+        bound = None
+        if external_events:
+            bound = external_events[0][0] - now
+        if until is not None:
+            bound = until - now if bound is None else min(bound, until - now)
+        if bound is not None and bound <= 0:
+            return 0
             
-        # Clear data request flag after processing
+        if not (self.data_request or self.paging_request):
+            k = self._quiet_ticks(sys.maxsize if bound is None else bound)
+            if bound is None and k == sys.maxsize:
+                # Nothing will change until an external event arrives
+                return 0
+            if k:
+                self._advance_quiet(k)
+                if k == bound:
+                    return k
+        self.tick()
+        return self.simulation_time - now
+        
+    def _run_compiled(self, n_ticks: int, data_ticks: 'np.ndarray', bursts: 'np.ndarray',
+                      pages: 'np.ndarray'):
+        """run_vectorized() body on _run_kernel(); events are sorted and within the horizon"""
+        if n_ticks <= 0:
+            return
+        start = self.simulation_time
+        pending = int(self.data_request) + int(self.paging_request)
+        # Each entry into CONNECTED needs an event and is followed by at most
+        # two timer transitions; two more may precede the first event
+        transitions = np.empty((3 * (len(data_ticks) + len(pages) + pending) + 2, 6),
+                               dtype=np.int64)
+        durations = np.zeros(len(RRCState), dtype=np.int64)
+        (state, self.inactivity_timer, self.long_inactivity_timer, self.data_burst_duration,
+         self.data_active, energy, self.hist_head, n_transitions) = _run_kernel(
+            self._state, self.inactivity_timer, self.long_inactivity_timer,
+            self.data_burst_duration, self.data_active, self.data_request, self.paging_request,
+            self.inactivity_threshold, self.long_inactivity_threshold,
+            data_ticks, bursts, pages, n_ticks, start,
+            self.packed_history, self.hist_head,
+            durations, transitions)
         self.data_request = False
+        self.paging_request = False
+        self._state = state
+        
+        self.total_energy += energy
+        for s, duration in enumerate(durations.tolist()):
+            self._state_dur[s] += duration
+        self.hist_count = min(self.hist_count + n_ticks, self.max_history_length)
+        self.simulation_time += n_ticks
+        transitions = transitions[:n_transitions].tolist()
+        if transitions:
+            self.previous_state = _STATES[transitions[-1][1]]
+            self.transition_count += n_transitions
+            
+        if not self.log_enabled:
+            return
+        # Rebuild the event log in the order the per-tick calls would have
+        # written it: data requests, then paging, then the tick's transition.
+        # Only the entries that survive the event log's cap are kept.
+        entries = [(t, 0, (_EV_DATA_REQUEST, burst))
+                   for t, burst in zip(np.maximum(data_ticks, 0).tolist(), bursts.tolist())]
+        entries += [(t, 1, (_EV_PAGING, 0)) for t in np.maximum(pages, 0).tolist()]
+        entries += [(row[0] - start, 2, self._transition_event(*row[1:])) for row in transitions]
+        entries.sort(key=lambda entry: entry[:2])
+        for t, _, event in entries[-self.event_log.maxlen:]:
+            self.event_log.append((start + t, event))
+        
+    def run_ticks_until_push(self, n_ticks: int, history_seconds: float = 10.0) -> StateSnapshot:
+        """
+        Advance n_ticks (see tick_n) and return the state for a GUI push.
+        
+        Replaces a per-tick loop followed by separate get_state() and
+        get_history() calls with one call per GUI update.
+        
+        Args:
+            n_ticks: Number of 1ms ticks to advance (0 just snapshots)
+            history_seconds: Seconds of history to attach to the snapshot
+            
+        Returns:
+            The engine's StateSnapshot with its history field filled in
+        """
+        self.tick_n(n_ticks)
+        snap = self.get_state()
+        snap.history = self.get_history(last_n_seconds=history_seconds)
+        return snap
         
-    def _calculate_energy(self):
-        """Integrate power consumption based on current state"""
-        power = self.POWER_CONSUMPTION[self.state]
-        self.total_energy += power
-        
-    def _record_history(self):
-        """Record state and signal history for plotting"""
-        # Implement ring buffer to prevent unbounded memory growth
-        if len(self.state_history) >= self.max_history_length:
-            # Remove oldest 10% when buffer is full
-            trim_size = self.max_history_length // 10
-            self.state_history = self.state_history[trim_size:]
-            self.data_request_history = self.data_request_history[trim_size:]
-            self.time_history = self.time_history[trim_size:]
+    def _quiet_ticks(self, n: int) -> int:
+        """
+        Number of upcoming ticks (at most n) with no state transition and
+        constant timer dynamics, so they can be applied in bulk.
+        """
+        if self._state == _CONNECTED:
+            if self.data_burst_duration > 0 and self.data_active:
+                # Data keeps flowing: inactivity timer pinned at 0
+                return min(n, self.data_burst_duration)
+            if self.data_burst_duration == 0 and not self.data_active:
+                # Counting up to the inactivity threshold
+                expiry = max(1, self.inactivity_threshold - self.inactivity_timer)
+                return min(n, expiry - 1)
+        elif self.data_burst_duration == 0:
+            if self._state == _INACTIVE:
+                # Counting up to the long inactivity threshold
+                expiry = max(1, self.long_inactivity_threshold - self.long_inactivity_timer)
+                return min(n, expiry - 1)
+            # IDLE stays IDLE until an external event
+            return n
+        return 0
+        
+    def _advance_quiet(self, k: int):
+        """Apply k quiet ticks (see _quiet_ticks) in one step"""
+        state = self._state
+        data_flowing = self.data_burst_duration > 0
+        if state == _CONNECTED and data_flowing:
+            self.inactivity_timer = 0
+        elif state == _CONNECTED:
+            self.inactivity_timer += k
+        else:
+            self.inactivity_timer = 0
+        if state == _INACTIVE:
+            self.long_inactivity_timer += k
+        else:
+            self.long_inactivity_timer = 0
+            
+        if data_flowing:
+            self.data_burst_duration -= k
+        self.data_active = data_flowing
+            
+        self.total_energy += POWER_BY_STATE[state] * k
+        self._state_dur[state] += k
+        
+        # Record history in bulk, wrapping around the ring buffer
+        size = self.max_history_length
+        sample = state | self.data_active << _DATA_SHIFT
+        # Only the newest `size` samples can survive
+        skip = max(0, k - size)
+        head = (self.hist_head + skip) % size
+        remaining = k - skip
+        while remaining > 0:
+            m = min(remaining, size - head)
+            if NUMPY_AVAILABLE:
+                self.packed_history[head:head + m] = sample
+            else:
+                # array.array slices only take an array of the same length
+                self.packed_history[head:head + m] = array('B', (sample,)) * m
+            head = (head + m) % size
+            remaining -= m
+        self.hist_head = head
+        self.hist_count = min(self.hist_count + k, size)
+            
+        self.simulation_time += k
+        
+    @staticmethod
+    def _transition_event(old_state: int, new_state: int, data_request: bool,
+                          inactivity_timer: int, long_inactivity_timer: int) -> Tuple[int, int]:
+        """Event log (code, value) pair for a transition taken by _step()"""
+        if old_state == _IDLE:
+            return (_EV_IDLE_TO_CONNECTED_DATA if data_request
+                    else _EV_IDLE_TO_CONNECTED_PAGING, 0)
+        if old_state == _CONNECTED:
+            return (_EV_CONNECTED_TO_INACTIVE, inactivity_timer)
+        if new_state == _CONNECTED:
+            return (_EV_INACTIVE_TO_CONNECTED, 0)
+        return (_EV_INACTIVE_TO_IDLE, long_inactivity_timer)
+        
+    def _log_event(self, event: Union[str, Tuple[int, int]]):
+        """Log an event (message or (code, value) pair) at the current tick"""
+        if self.log_enabled:
+            self.event_log.append((self.simulation_time, event))
             
-        self.state_history.append(int(self.state))
-        self.data_request_history.append(1 if (self.data_active or self.data_request) else 0)
-        self.time_history.append(self.simulation_time / 1000.0)  # Convert to seconds
-        
-    def _log_event(self, message: str):
-        """Log a timestamped event"""
-        timestamp = self.simulation_time / 1000.0  # Convert to seconds
-        self.event_log.append((timestamp, message))
-        # Keep only last 1000 events
-        if len(self.event_log) > 1000:
-            self.event_log = self.event_log[-1000:]
+    def format_events(self) -> List[Tuple[int, str]]:
+        """
+        Render the event log as text.
+        
+        Returns:
+            (tick, message) pairs, oldest first
+        """
+        return [(tick, event if isinstance(event, str)
+                 else _EVENT_TEXT[event[0]].format(event[1]))
+                for tick, event in self.event_log]
             
     # === Public API for external control ===
     
@@ -251,12 +612,12 @@ class RRCSimulationEngine:
         """
         self.data_request = True
         self.data_burst_duration = burst_duration_ms
-        self._log_event(f"Data request triggered (burst: {burst_duration_ms}ms)")
+        self._log_event((_EV_DATA_REQUEST, burst_duration_ms))
         
     def trigger_paging(self):
         """Trigger a network paging event"""
         self.paging_request = True
-        self._log_event("Paging request triggered")
+        self._log_event((_EV_PAGING, 0))
         
     def set_traffic_profile(self, profile: str):
         """
@@ -266,39 +627,68 @@ class RRCSimulationEngine:
             profile: "Streaming" or "IoT"
         """
         if profile.lower() == "streaming":
-            self.traffic_profile = TrafficProfile.STREAMING
-            self.inactivity_threshold = self.TIMER_THRESHOLDS[TrafficProfile.STREAMING]
-            self.long_inactivity_threshold = self.LONG_INACTIVITY_THRESHOLDS[TrafficProfile.STREAMING]
-            self._log_event("Traffic profile: STREAMING (CONN→INACT: 10s, INACT→IDLE: 20s)")
+            index = _STREAMING
+            message = "Traffic profile: STREAMING (CONN→INACT: 10s, INACT→IDLE: 20s)"
         elif profile.lower() == "iot":
-            self.traffic_profile = TrafficProfile.IOT
-            self.inactivity_threshold = self.TIMER_THRESHOLDS[TrafficProfile.IOT]
-            self.long_inactivity_threshold = self.LONG_INACTIVITY_THRESHOLDS[TrafficProfile.IOT]
-            self._log_event("Traffic profile: IoT (CONN→INACT: 200ms, INACT→IDLE: 5s)")
+            index = _IOT
+            message = "Traffic profile: IoT (CONN→INACT: 200ms, INACT→IDLE: 5s)"
         else:
             raise ValueError(f"Unknown traffic profile: {profile}")
+        self._traffic_profile = index
+        self.inactivity_threshold = INACTIVITY_TH[index]
+        self.long_inactivity_threshold = LONG_INACTIVITY_TH[index]
+        self._log_event(message)
             
-    def get_state(self) -> Dict:
+    def get_state(self) -> StateSnapshot:
         """
-        Get current simulation state snapshot (thread-safe).
+        Get current simulation state snapshot.
+        
+        The engine's single StateSnapshot is refreshed and returned, so a
+        caller that needs to keep a value across later get_state() calls
+        must copy it (e.g. with asdict()) or ship it off (pickling copies).
         
         Returns:
-            Dictionary containing all relevant state information
+            StateSnapshot containing all relevant state information
         """
-        return {
-            'state': int(self.state),
-            'state_name': self.state.name,
-            'simulation_time': self.simulation_time / 1000.0,  # seconds
-            'total_energy': self.total_energy,
-            'inactivity_timer': self.inactivity_timer,
-            'long_inactivity_timer': self.long_inactivity_timer,
-            'inactivity_threshold': self.inactivity_threshold,
-            'long_inactivity_threshold': self.long_inactivity_threshold,
-            'traffic_profile': self.traffic_profile.name,
-            'data_active': self.data_active,
-            'transition_count': self.transition_count,
-            'state_durations': dict(self.state_durations),
-        }
+        snap = self._snapshot
+        snap.state = self._state
+        snap.state_name = _STATES[self._state].name
+        snap.tick = self.simulation_time
+        snap.simulation_time = self.simulation_time / 1000.0  # seconds
+        snap.total_energy = self.total_energy
+        snap.inactivity_timer = self.inactivity_timer
+        snap.long_inactivity_timer = self.long_inactivity_timer
+        snap.inactivity_threshold = self.inactivity_threshold
+        snap.long_inactivity_threshold = self.long_inactivity_threshold
+        snap.traffic_profile = _PROFILES[self._traffic_profile].name
+        snap.data_active = self.data_active
+        snap.transition_count = self.transition_count
+        snap.state_durations = tuple(self._state_dur)
+        snap.history = None  # only run_ticks_until_push() attaches history
+        return snap
+        
+    @property
+    def state(self) -> RRCState:
+        """Current RRC state (stored internally as a plain int)"""
+        return _STATES[self._state]
+        
+    @state.setter
+    def state(self, value: RRCState):
+        self._state = int(value)
+        
+    @property
+    def traffic_profile(self) -> TrafficProfile:
+        """Current traffic profile (stored internally as a plain int)"""
+        return _PROFILES[self._traffic_profile]
+        
+    @traffic_profile.setter
+    def traffic_profile(self, value: TrafficProfile):
+        self._traffic_profile = int(value)
+        
+    @property
+    def state_durations(self) -> Dict[RRCState, int]:
+        """Ticks spent in each state, keyed by RRCState (a fresh dict)"""
+        return dict(zip(RRCState, self._state_dur))
         
     def get_history(self, last_n_seconds: float = 10.0) -> Dict:
         """
@@ -308,38 +698,286 @@ class RRCSimulationEngine:
             last_n_seconds: Number of seconds of history to return
             
         Returns:
-            Dictionary with time, state, and data_request arrays
+            Dictionary with time, state, and data_request arrays (oldest first;
+            array.array instead of ndarray when NumPy is not installed)
         """
-        if not self.time_history:
+        # The buffers hold the hist_count ticks just before the current
+        # tick, so the window length follows from the tick count alone
+        n = min(self.hist_count, max(0, round(last_n_seconds * 1000)))
+        start = self.hist_head - n
+        if start >= 0:
+            parts = [slice(start, self.hist_head)]
+        else:
+            # Window wraps past the end of the ring buffer
+            parts = [slice(start + self.max_history_length, None), slice(0, self.hist_head)]
+            
+        if not NUMPY_AVAILABLE:
+            packed = array('B')
+            for part in parts:
+                packed += self.packed_history[part]
             return {
-                'time': [],
-                'state': [],
-                'data_request': []
+                'time': array('d', [t / 1000.0 for t in range(self.simulation_time - n,
+                                                              self.simulation_time)]),
+                'state': array('b', [sample & _STATE_MASK for sample in packed]),
+                'data_request': array('B', [sample >> _DATA_SHIFT for sample in packed]),
             }
             
-        # Find index for last_n_seconds
-        current_time = self.simulation_time / 1000.0
-        cutoff_time = current_time - last_n_seconds
-        
-        # Binary search would be faster, but linear is simpler for now
-        start_idx = 0
-        for i, t in enumerate(self.time_history):
-            if t >= cutoff_time:
-                start_idx = i
-                break
-                
+        packed = np.concatenate([self.packed_history[part] for part in parts])
         return {
-            'time': self.time_history[start_idx:],
-            'state': self.state_history[start_idx:],
-            'data_request': self.data_request_history[start_idx:]
+            'time': np.arange(self.simulation_time - n, self.simulation_time) / 1000.0,
+            'state': (packed & _STATE_MASK).view(np.int8),
+            'data_request': packed >> _DATA_SHIFT,
         }
         
     def reset(self):
-        """Reset simulation to initial state"""
+        """Reset simulation to initial state (log_enabled is kept)"""
+        log_enabled = self.log_enabled
         self.__init__()
+        self.log_enabled = log_enabled
         self._log_event("Simulation reset")
 
 
+# ===== Compiled state machine kernels =====
+
+# Integer state codes and per-state power for the kernels
+_IDLE = int(RRCState.IDLE)
+_CONNECTED = int(RRCState.CONNECTED)
+_INACTIVE = int(RRCState.INACTIVE)
+_STREAMING = int(TrafficProfile.STREAMING)
+_IOT = int(TrafficProfile.IOT)
+_POWER = tuple(float(power) for power in POWER_BY_STATE)
+_STATES = tuple(RRCState)
+_PROFILES = tuple(TrafficProfile)
+
+# Event log codes; _EVENT_TEXT formats each code's value into its message
+(_EV_IDLE_TO_CONNECTED_DATA, _EV_IDLE_TO_CONNECTED_PAGING, _EV_CONNECTED_TO_INACTIVE,
+ _EV_INACTIVE_TO_CONNECTED, _EV_INACTIVE_TO_IDLE, _EV_DATA_REQUEST, _EV_PAGING) = range(7)
+_EVENT_TEXT = (
+    "Transition: IDLE -> CONNECTED (trigger: data)",
+    "Transition: IDLE -> CONNECTED (trigger: paging)",
+    "Transition: CONNECTED -> INACTIVE (inactivity: {}ms)",
+    "Transition: INACTIVE -> CONNECTED (fast resume)",
+    "Transition: INACTIVE -> IDLE (long inactivity: {}ms)",
+    "Data request triggered (burst: {}ms)",
+    "Paging request triggered",
+)
+
+# Packed history sample layout: state in the low two bits, data flag in bit 4
+_STATE_MASK = 0x3
+_DATA_SHIFT = 4
+_DATA_BIT = 1 << _DATA_SHIFT
+
+
+def _next_state(state: int, data_request: bool, paging_request: bool,
+                inactivity_expired: bool, long_inactivity_expired: bool,
+                data_active: bool) -> int:
+    """
+    3GPP TS 38.331 state transition rule, evaluated once per table entry.
+    
+    Transition diagram:
+                data_request
+        IDLE -----------------> CONNECTED
+         ^                          |
+         |                          | inactivity_timer > threshold
+         |                          v
+         |                     INACTIVE
+         |                          |
+         +<-------------------------+
+             long_inactivity_timer > threshold
+             
+    Fast resume: INACTIVE --data_request--> CONNECTED
+    """
+    if state == _IDLE:
+        # IDLE -> CONNECTED: On data request or paging
+        if data_request or paging_request:
+            return _CONNECTED
+    elif state == _CONNECTED:
+        # CONNECTED -> INACTIVE: On inactivity timer expiry
+        if inactivity_expired and not data_active:
+            return _INACTIVE
+    else:
+        # INACTIVE -> CONNECTED: Fast resume on data request
+        if data_request:
+            return _CONNECTED
+        # INACTIVE -> IDLE: On long inactivity timer expiry
+        if long_inactivity_expired:
+            return _IDLE
+    return state
+
+
+# Next state for every combination of (state, data_request, paging_request,
+# inactivity expired, long inactivity expired, data_active), flattened with
+# the state in the highest position: index = state * 32 + data_request * 16
+# + paging_request * 8 + inactivity expired * 4 + long expired * 2 + data_active
+_NEXT_STATE = tuple(_next_state(*key) for key in itertools.product(
+    range(len(RRCState)), (False, True), (False, True), (False, True), (False, True),
+    (False, True)))
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _step(state, inactivity_timer, long_inactivity_timer, data_burst_duration, data_active,
+          data_request, paging_request, inactivity_threshold, long_inactivity_threshold):
+    """
+    One tick of timer updates and state transition (see _next_state).
+    
+    The transition is a lookup in the precomputed _NEXT_STATE table
+    rather than a chain of branches on the state and event flags.
+    RRCSimulationEngine.tick() carries an inlined copy for the interpreted
+    per-tick path; keep the two in step.
+    
+    Returns:
+        (state, inactivity_timer, long_inactivity_timer, data_burst_duration,
+         data_active, power)
+    """
+    # Inactivity timer (for CONNECTED -> INACTIVE): reset while data is
+    # active or in other states
+    if state == _CONNECTED and not data_active:
+        inactivity_timer += 1
+    else:
+        inactivity_timer = 0
+        
+    # Long inactivity timer (for INACTIVE -> IDLE)
+    if state == _INACTIVE:
+        long_inactivity_timer += 1
+    else:
+        long_inactivity_timer = 0
+        
+    # Data burst duration countdown
+    data_active = data_burst_duration > 0
+    if data_active:
+        data_burst_duration -= 1
+        
+    state = _NEXT_STATE[state * 32 + data_request * 16 + paging_request * 8
+                        + (inactivity_timer >= inactivity_threshold) * 4
+                        + (long_inactivity_timer >= long_inactivity_threshold) * 2
+                        + data_active]
+    return (state, inactivity_timer, long_inactivity_timer, data_burst_duration,
+            data_active, _POWER[state])
+
+
+# fastmath only reorders the energy sum, whose terms are small integers
+# (exact in float64); the loop indexes within bounds by construction
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _run_kernel(state, inactivity_timer, long_inactivity_timer, data_burst_duration,
+                data_active, data_request, paging_request,
+                inactivity_threshold, long_inactivity_threshold,
+                data_ticks, data_bursts, paging_ticks, n_ticks, start_tick,
+                history, head, durations, transitions):
+    """
+    Compiled loop of _step() over n_ticks with a prescheduled event list.
+    
+    Writes each tick into the packed history ring buffer starting at head, adds
+    the time spent per state into durations, and records each transition
+    as a (tick, from state, to state, data request, inactivity timer, long
+    inactivity timer) row of transitions for the event log.
+    
+    Returns:
+        (state, inactivity_timer, long_inactivity_timer, data_burst_duration,
+         data_active, energy, head, transition rows used)
+    """
+    size = len(history)
+    n_data = len(data_ticks)
+    n_paging = len(paging_ticks)
+    di = 0
+    pi = 0
+    n_transitions = 0
+    energy = 0.0
+    for t in range(n_ticks):
+        # Trigger scheduled events (a later data request at the same tick wins)
+        while di < n_data and data_ticks[di] <= t:
+            data_request = True
+            data_burst_duration = data_bursts[di]
+            di += 1
+        while pi < n_paging and paging_ticks[pi] <= t:
+            paging_request = True
+            pi += 1
+            
+        old_state = state
+        (state, inactivity_timer, long_inactivity_timer, data_burst_duration,
+         data_active, power) = _step(state, inactivity_timer, long_inactivity_timer,
+                                     data_burst_duration, data_active, data_request,
+                                     paging_request, inactivity_threshold,
+                                     long_inactivity_threshold)
+        if state != old_state:
+            row = transitions[n_transitions]
+            row[0] = start_tick + t
+            row[1] = old_state
+            row[2] = state
+            row[3] = data_request
+            row[4] = inactivity_timer
+            row[5] = long_inactivity_timer
+            n_transitions += 1
+        data_request = False
+        paging_request = False
+        
+        energy += power
+        durations[state] += 1
+        history[head] = state | (_DATA_BIT if data_active else 0)
+        head += 1
+        if head == size:
+            head = 0
+            
+    return (state, inactivity_timer, long_inactivity_timer, data_burst_duration,
+            data_active, energy, head, n_transitions)
+
+
+def simulate_one(params: Dict) -> Dict:
+    """
+    Run one independent simulation on a fresh engine.
+    
+    Module-level (and so picklable) for run_sweep() workers.
+    
+    Args:
+        params: Dictionary with
+            n_ticks: Number of 1ms ticks to simulate (required)
+            traffic_profile: "Streaming" or "IoT" (default "IoT")
+            inactivity_threshold, long_inactivity_threshold: Optional
+                overrides of the profile's timer thresholds (ticks)
+            data_events: (tick, burst_ms) pairs (default none)
+            paging_ticks: Paging ticks (default none)
+            
+    Returns:
+        Final get_state() fields as a plain dictionary (without history)
+    """
+    engine = RRCSimulationEngine()
+    engine.set_traffic_profile(params.get('traffic_profile', 'IoT'))
+    if 'inactivity_threshold' in params:
+        engine.inactivity_threshold = params['inactivity_threshold']
+    if 'long_inactivity_threshold' in params:
+        engine.long_inactivity_threshold = params['long_inactivity_threshold']
+        
+    events = list(params.get('data_events', ()))
+    engine.run_vectorized(params['n_ticks'], [tick for tick, _ in events],
+                          [burst for _, burst in events], params.get('paging_ticks', ()))
+    
+    stats = engine.get_state().asdict()
+    del stats['history']
+    return stats
+
+
+def run_sweep(param_list: Iterable[Dict], n_workers: int = None) -> List[Dict]:
+    """
+    Run simulate_one() for each parameter set across worker processes.
+    
+    Every run gets its own engine, so results do not depend on which
+    worker runs them or in what order.
+    
+    Args:
+        param_list: Parameter dictionaries (see simulate_one)
+        n_workers: Number of worker processes (default: os.cpu_count())
+        
+    Returns:
+        simulate_one() results, in param_list order
+    """
+    param_list = list(param_list)
+    if not param_list:
+        return []
+    workers = min(n_workers or os.cpu_count() or 1, len(param_list))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(simulate_one, param_list,
+                                 chunksize=max(1, len(param_list) // (4 * workers))))
+
+
 # Example usage and testing
 if __name__ == "__main__":
     print("5G NR RRC State Machine Simulation Engine")
@@ -354,19 +992,16 @@ if __name__ == "__main__":
     
     engine.set_traffic_profile("IoT")
     
-    # Simulate 2 seconds
-    for tick in range(2000):
-        # Send data burst every 500ms
-        if tick % 500 == 0 and tick > 0:
-            engine.trigger_data_request(burst_duration_ms=100)
-            
-        engine.tick()
+    # Simulate 2 seconds, sending a data burst every 500ms
+    engine.run(2000, [(tick, 100) for tick in range(500, 2000, 500)])
+    
+    # Print state changes
+    history = engine.get_history(last_n_seconds=2.0)
+    states = history['state']
+    for i in range(1, len(states)):
+        if states[i] != states[i - 1]:
+            print(f"[{history['time'][i]:.3f}s] State: {RRCState(states[i]).name}")
         
-        # Print state changes
-        if tick > 0 and engine.state != engine.previous_state:
-            state_info = engine.get_state()
-            print(f"[{state_info['simulation_time']:.3f}s] State: {state_info['state_name']}")
-            
     # Print final statistics
     print("\n" + "=" * 50)
     print("Final Statistics:")
@@ -375,9 +1010,9 @@ if __name__ == "__main__":
     print(f"Total Energy: {state_info['total_energy']:.0f} units")
     print(f"State Transitions: {state_info['transition_count']}")
     print(f"\nTime in each state:")
-    for state, duration in state_info['state_durations'].items():
+    for state, duration in enumerate(state_info['state_durations']):
         print(f"  {RRCState(state).name}: {duration}ms ({duration/20:.1f}%)")
         
     print("\nRecent events:")
-    for timestamp, event in engine.event_log[-10:]:
-        print(f"  [{timestamp:.3f}s] {event}")
+    for tick, event in engine.format_events()[-10:]:
+        print(f"  [{tick * 1e-3:.3f}s] {event}")
@@ -0,0 +1,197 @@
+"""
+Unit tests for the comparative timer study
+
+Checks the study's batch simulation against a plain engine tick() loop,
+the on-disk result cache and the vectorized derived-metric math.
+
+Run with: python3 -m pytest test_comparative_study.py -v
+Or simply: python3 test_comparative_study.py
+"""
+
+import os
+import sys
+import tempfile
+import numpy as np
+import comparative_study
+from comparative_study import (RESULT_DTYPE, TimerComparativeStudy, _cache_key,
+                               _fill_derived_metrics, _run_one, _split_schedule)
+from rrc_simulation_engine import RRCSimulationEngine, RRCState
+
+
+CONFIGS = [
+    {'name': 'Static_1s', 'static_threshold': 1000, 'static_long_threshold': 10000},
+    {'name': 'Static_tiny', 'static_threshold': 30, 'static_long_threshold': 80},
+    {'name': 'Adaptive_IoT', 'profile': 'IoT'},
+    {'name': 'Adaptive_Streaming', 'profile': 'Streaming'},
+]
+
+
+def _tick_counts(data_pattern, duration_ms, timer_config):
+    """Reference counters from one tick() per millisecond"""
+    engine = RRCSimulationEngine()
+    if 'static_threshold' in timer_config:
+        engine.inactivity_threshold = timer_config['static_threshold']
+        engine.long_inactivity_threshold = timer_config['static_long_threshold']
+    else:
+        engine.set_traffic_profile(timer_config['profile'])
+    
+    # Bursts due at or before a tick fire there, in schedule order
+    schedule = sorted(enumerate(data_pattern), key=lambda entry: (entry[1][0], entry[0]))
+    i = 0
+    for t in range(duration_ms):
+        while i < len(schedule) and schedule[i][1][0] <= t:
+            engine.trigger_data_request(burst_duration_ms=int(schedule[i][1][1]))
+            i += 1
+        engine.tick()
+    
+    durations = engine.state_durations
+    return (engine.total_energy, engine.transition_count, durations[RRCState.IDLE],
+            durations[RRCState.CONNECTED], durations[RRCState.INACTIVE])
+
+
+def test_split_schedule():
+    """Verify _split_schedule() sorts stably and keeps sorted input as-is"""
+    print("Test 1: Burst schedule splitting...")
+    times, durs = _split_schedule([(0, 10), (50, 20), (50, 30)])
+    assert times.tolist() == [0, 50, 50] and durs.tolist() == [10, 20, 30]
+    
+    # Out-of-order input: same-time bursts keep their relative order
+    times, durs = _split_schedule([(300, 1), (-5, 2), (300, 3), (10, 4)])
+    assert times.tolist() == [-5, 10, 300, 300]
+    assert durs.tolist() == [2, 4, 1, 3]
+    
+    times, durs = _split_schedule(np.empty((0, 2), dtype=np.int64))
+    assert len(times) == 0 and len(durs) == 0
+    
+    print("  [OK] PASSED")
+
+
+def test_simulate_counts_matches_tick():
+    """Verify simulate_counts() matches a tick() loop on random schedules"""
+    print("Test 2: Study simulation matches per-tick stepping...")
+    rng = np.random.default_rng(7)
+    duration = 3000
+    for trial in range(12):
+        n_bursts = int(rng.integers(0, 15))
+        # Unsorted, duplicated, negative and past-the-horizon burst times
+        times = rng.integers(-50, duration + 200, size=n_bursts)
+        if n_bursts > 1:
+            times[-1] = times[0]
+        bursts = rng.choice([1, 20, 100, 500], size=n_bursts)
+        pattern = [(int(t), int(b)) for t, b in zip(times, bursts)]
+        for config in CONFIGS:
+            expected = _tick_counts(pattern, duration, config)
+            got = TimerComparativeStudy.simulate_counts(pattern, duration, config)
+            assert got == expected, f"Trial {trial} {config['name']}: {got} != {expected}"
+    
+    print("  [OK] PASSED")
+
+
+def test_cache_hit_matches_miss():
+    """Verify a cached _run_one() result equals the freshly simulated one"""
+    print("Test 3: Scenario result cache...")
+    scenario = {'name': 'Cache_Test', 'pattern': np.array([(0, 50), (900, 20)]), 'duration': 5000}
+    config = CONFIGS[2]
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = os.path.join(cache_dir, _cache_key(scenario, config) + '.pkl')
+        miss = _run_one((scenario, config, cache_dir))
+        assert os.path.exists(cache_path), "Miss should write a cache entry"
+        
+        hit = _run_one((scenario, config, cache_dir))
+        assert hit == miss, f"Cache hit {hit} differs from miss {miss}"
+        assert miss == _run_one((scenario, config, None))
+        
+        # A truncated entry is ignored and rewritten
+        with open(cache_path, 'wb') as f:
+            f.write(b'\x80')
+        assert _run_one((scenario, config, cache_dir)) == miss
+        assert _run_one((scenario, config, cache_dir)) == miss
+    
+    # Any input change, a cache version bump or a code change gives a new key
+    key = _cache_key(scenario, config)
+    assert _cache_key(scenario, CONFIGS[3]) != key
+    assert _cache_key(dict(scenario, duration=6000), config) != key
+    version = comparative_study._CACHE_VERSION
+    try:
+        comparative_study._CACHE_VERSION = version + 1
+        assert _cache_key(scenario, config) != key, "Version bump should invalidate the cache"
+    finally:
+        comparative_study._CACHE_VERSION = version
+    fingerprint = comparative_study._SOURCE_FINGERPRINT
+    try:
+        comparative_study._SOURCE_FINGERPRINT = '0' * len(fingerprint)
+        assert _cache_key(scenario, config) != key, "Code change should invalidate the cache"
+    finally:
+        comparative_study._SOURCE_FINGERPRINT = fingerprint
+    
+    print("  [OK] PASSED")
+
+
+def test_derived_metrics_match_run_scenario():
+    """Verify _fill_derived_metrics() matches run_scenario()'s per-run math"""
+    print("Test 4: Derived metrics...")
+    cases = [
+        ([(0, 50), (900, 20)], 5000, CONFIGS[2]),
+        ([(100, 5000)], 8000, CONFIGS[0]),
+        ([], 2000, CONFIGS[3]),  # all IDLE: efficiency falls back to 0
+    ]
+    results = np.zeros(len(cases), dtype=RESULT_DTYPE)
+    expected = []
+    for i, (pattern, duration, config) in enumerate(cases):
+        row = TimerComparativeStudy.run_scenario('Metrics', pattern, duration, config, config['name'])
+        for field in ('total_energy', 'transitions', 'idle_time_ms',
+                      'connected_time_ms', 'inactive_time_ms'):
+            results[field][i] = row[field]
+        expected.append(row)
+    _fill_derived_metrics(results, np.array([duration for _, duration, _ in cases]))
+    
+    for record, row in zip(results, expected):
+        for field in ('idle_pct', 'connected_pct', 'inactive_pct', 'efficiency',
+                      'avg_energy_per_sec'):
+            assert np.isclose(record[field], row[field], rtol=1e-6), \
+                f"{field}: {record[field]} != {row[field]}"
+    assert results['efficiency'][2] == 0
+    
+    print("  [OK] PASSED")
+
+
+def run_all_tests():
+    """Run all test cases"""
+    print("="*60)
+    print("Comparative Study - Unit Tests")
+    print("="*60)
+    print()
+    
+    tests = [
+        test_split_schedule,
+        test_simulate_counts_matches_tick,
+        test_cache_hit_matches_miss,
+        test_derived_metrics_match_run_scenario,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ ERROR: {e}")
+            failed += 1
+    
+    print()
+    print("="*60)
+    print(f"Results: {passed} passed, {failed} failed out of {len(tests)} tests")
+    print("="*60)
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
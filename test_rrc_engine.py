@@ -8,7 +8,11 @@ Or simply: python3 test_rrc_engine.py
 """
 
 import sys
-from rrc_simulation_engine import RRCSimulationEngine, RRCState
+from array import array
+from collections import deque
+import numpy as np
+import rrc_simulation_engine
+from rrc_simulation_engine import RRCSimulationEngine, RRCState, run_sweep, simulate_one
 
 
 def test_idle_to_connected_on_data():
@@ -193,6 +197,258 @@ def test_get_state_snapshot():
     print("  [OK] PASSED")
 
 
+def test_tick_n_matches_tick():
+    """Verify tick_n(n) is equivalent to n individual ticks"""
+    print("Test 11: Bulk tick_n() matches per-tick stepping...")
+    stepped = RRCSimulationEngine()
+    bulk = RRCSimulationEngine()
+    
+    # (ticks to advance, burst to trigger afterwards)
+    schedule = [(0, 50), (30, None), (400, 100), (60, 20), (6000, 500), (250, None), (7000, None)]
+    for n_ticks, burst in schedule:
+        for _ in range(n_ticks):
+            stepped.tick()
+        bulk.tick_n(n_ticks)
+        
+        assert bulk.get_state() == stepped.get_state(), f"State diverged after {n_ticks} ticks"
+        bulk_history = bulk.get_history(last_n_seconds=1000.0)
+        stepped_history = stepped.get_history(last_n_seconds=1000.0)
+        for key in ('time', 'state', 'data_request'):
+            assert np.array_equal(bulk_history[key], stepped_history[key]), f"{key} history diverged"
+        
+        if burst is not None:
+            stepped.trigger_data_request(burst_duration_ms=burst)
+            bulk.trigger_data_request(burst_duration_ms=burst)
+            
+    print("  [OK] PASSED")
+
+
+def test_state_snapshot_reused():
+    """Verify get_state() refreshes one reusable snapshot in place"""
+    print("Test 12: Reusable state snapshot...")
+    engine = RRCSimulationEngine()
+    
+    first = engine.get_state()
+    saved = first.asdict()
+    engine.trigger_data_request(burst_duration_ms=50)
+    engine.tick()
+    second = engine.get_state()
+    
+    assert second is first, "get_state() should reuse its snapshot"
+    assert saved['state'] == RRCState.IDLE, "asdict() copy should not change"
+    assert second['state'] == RRCState.CONNECTED
+    assert second.get('tick') == 1
+    assert second.get('missing', 'default') == 'default'
+    assert second['state_durations'] == (0, 1, 0)
+    assert saved['state_durations'] == (0, 0, 0), "Durations should be a copy"
+    
+    print("  [OK] PASSED")
+
+
+def test_run_ticks_until_push():
+    """Verify run_ticks_until_push() advances and returns state with history"""
+    print("Test 13: Batched ticks with state push...")
+    engine = RRCSimulationEngine()
+    engine.trigger_data_request(burst_duration_ms=20)
+    
+    state = engine.run_ticks_until_push(50, history_seconds=10.0)
+    assert state['tick'] == 50
+    assert state['state'] == RRCState.CONNECTED
+    assert len(state['history']['state']) == 50
+    assert state['history']['data_request'][:20].all(), "Burst should be recorded"
+    assert not state['history']['data_request'][21:].any()
+    
+    # The pushed values match a plain tick() loop
+    stepped = RRCSimulationEngine()
+    stepped.trigger_data_request(burst_duration_ms=20)
+    for _ in range(50):
+        stepped.tick()
+    pushed = state.asdict()
+    pushed_history = pushed.pop('history')
+    expected = stepped.get_state().asdict()
+    assert expected.pop('history') is None
+    assert pushed == expected, "Pushed state differs from tick() loop"
+    expected_history = stepped.get_history(last_n_seconds=10.0)
+    for key in ('time', 'state', 'data_request'):
+        assert np.array_equal(pushed_history[key], expected_history[key]), f"{key} history differs"
+    
+    # A later get_state() must not carry the pushed history along
+    engine.tick_n(500)
+    for _ in range(500):
+        stepped.tick()
+    state = engine.get_state()
+    assert state['tick'] == 550
+    assert state['history'] is None, "get_state() returned a stale history"
+    assert state.asdict() == stepped.get_state().asdict()
+    
+    # The next push carries the full, current history
+    state = engine.run_ticks_until_push(0, history_seconds=10.0)
+    history = state['history']
+    assert len(history['state']) == 550
+    assert history['time'][-1] == 0.549, f"Stale history ends at {history['time'][-1]}"
+    assert np.array_equal(history['state'], stepped.get_history(last_n_seconds=10.0)['state'])
+    
+    print("  [OK] PASSED")
+
+
+def test_run_vectorized_matches_tick():
+    """Verify run_vectorized() matches per-tick stepping with scheduled events"""
+    print("Test 14: Scheduled-event batch run matches per-tick stepping...")
+    data_ticks = [0, 300, 310, 6000]
+    bursts = [50, 120, 10, 30]
+    paging_ticks = [9000]
+    
+    batch = RRCSimulationEngine()
+    batch.run_vectorized(12000, data_ticks, bursts, paging_ticks)
+    
+    stepped = RRCSimulationEngine()
+    schedule = dict(zip(data_ticks, bursts))
+    for t in range(12000):
+        if t in schedule:
+            stepped.trigger_data_request(burst_duration_ms=schedule[t])
+        if t in paging_ticks:
+            stepped.trigger_paging()
+        stepped.tick()
+        
+    assert batch.get_state().asdict() == stepped.get_state().asdict()
+    assert batch.event_log == stepped.event_log
+    batch_history = batch.get_history(last_n_seconds=12.0)
+    stepped_history = stepped.get_history(last_n_seconds=12.0)
+    for key in ('time', 'state', 'data_request'):
+        assert np.array_equal(batch_history[key], stepped_history[key]), f"{key} history differs"
+    
+    print("  [OK] PASSED")
+
+
+def test_run_with_data_events():
+    """Verify run() applies a (tick, burst) schedule like a tick() loop"""
+    print("Test 15: Batch run with data events...")
+    engine = RRCSimulationEngine()
+    engine.run(1000, [(0, 50), (900, 10)])
+    assert engine.simulation_time == 1000
+    
+    # CONNECTED at 0, INACTIVE after 50ms burst + 200ms timer, resume at 900
+    assert engine.state == RRCState.CONNECTED
+    assert engine.transition_count == 3, f"Expected 3 transitions, got {engine.transition_count}"
+    
+    engine.run(10)
+    assert engine.simulation_time == 1010, "run() without events should just advance"
+    
+    print("  [OK] PASSED")
+
+
+def test_advance_to_next_event():
+    """Verify advance_to_next_event() jumps between event and expiry ticks"""
+    print("Test 16: Jump to next event...")
+    engine = RRCSimulationEngine()
+    engine.set_traffic_profile("IoT")  # 200ms threshold
+    events = deque([(100, 50)])
+    
+    # Nothing happens in IDLE until the scheduled request at tick 100
+    assert engine.advance_to_next_event(events) == 100
+    assert engine.state == RRCState.IDLE and len(events) == 1
+    assert engine.advance_to_next_event(events) == 1
+    assert engine.state == RRCState.CONNECTED and not events
+    
+    # Burst end, then timer expiry at tick 350 (50ms burst + 200ms timer)
+    calls = 0
+    while engine.state == RRCState.CONNECTED:
+        engine.advance_to_next_event(events)
+        calls += 1
+    assert engine.state == RRCState.INACTIVE
+    assert engine.simulation_time == 351, f"Expected expiry at tick 350, got {engine.simulation_time - 1}"
+    assert calls <= 4, f"Expected a few jumps, took {calls}"
+    
+    # IDLE with nothing scheduled has no next event
+    engine.reset()
+    assert engine.advance_to_next_event() == 0
+    
+    print("  [OK] PASSED")
+
+
+def test_run_sweep():
+    """Verify run_sweep() matches serial simulate_one() runs"""
+    print("Test 17: Parallel parameter sweep...")
+    params = [
+        {'n_ticks': 6000, 'traffic_profile': profile, 'data_events': [(0, 50), (interval, 50)]}
+        for profile in ("IoT", "Streaming") for interval in (100, 1000, 3000)
+    ]
+    params.append({'n_ticks': 1000, 'inactivity_threshold': 50, 'paging_ticks': [10]})
+    
+    results = run_sweep(params, n_workers=2)
+    assert results == [simulate_one(p) for p in params], "Sweep results differ from serial runs"
+    
+    # Paging at tick 10, 50ms timer: CONNECTED for ticks 10-59
+    assert results[-1]['state_durations'][RRCState.CONNECTED] == 50
+    assert results[-1]['transition_count'] == 2
+    
+    print("  [OK] PASSED")
+
+
+def test_event_log():
+    """Verify event log formatting and the log_enabled switch"""
+    print("Test 18: Event log...")
+    engine = RRCSimulationEngine()
+    engine.trigger_data_request(50)
+    engine.tick_n(300)
+    assert engine.format_events() == [
+        (0, "Data request triggered (burst: 50ms)"),
+        (0, "Transition: IDLE -> CONNECTED (trigger: data)"),
+        (250, "Transition: CONNECTED -> INACTIVE (inactivity: 200ms)"),
+    ], f"Unexpected events: {engine.format_events()}"
+    
+    # Switching logging off leaves the simulation itself unchanged
+    quiet = RRCSimulationEngine()
+    quiet.log_enabled = False
+    quiet.trigger_data_request(50)
+    quiet.tick_n(300)
+    assert not quiet.event_log, "Nothing should be logged"
+    assert quiet.get_state() == engine.get_state()
+    
+    print("  [OK] PASSED")
+
+
+def test_array_history_fallback():
+    """Verify the array.array fallback (no NumPy) matches the NumPy path"""
+    print("Test 19: History without NumPy...")
+    # Run past the 100s ring buffer so the history window wraps around
+    n_ticks = 110000
+    data_ticks = [0, 300, 310, 6000, 104000]
+    bursts = [50, 120, 10, 30, 2000]
+    paging_ticks = [9000, 60000]
+    
+    def run(engine):
+        engine.run_vectorized(n_ticks, data_ticks, bursts, paging_ticks)
+        engine.trigger_data_request(burst_duration_ms=5)
+        engine.tick_n(20)
+        return engine
+        
+    reference = run(RRCSimulationEngine())
+    numpy_available = rrc_simulation_engine.NUMPY_AVAILABLE
+    numba_available = rrc_simulation_engine.NUMBA_AVAILABLE
+    try:
+        rrc_simulation_engine.NUMPY_AVAILABLE = False
+        rrc_simulation_engine.NUMBA_AVAILABLE = False  # compiled path needs NumPy
+        fallback = run(RRCSimulationEngine())
+        assert isinstance(fallback.packed_history, array), "Expected an array.array buffer"
+        history = fallback.get_history(last_n_seconds=12.0)
+        full_history = fallback.get_history(last_n_seconds=200.0)
+    finally:
+        rrc_simulation_engine.NUMPY_AVAILABLE = numpy_available
+        rrc_simulation_engine.NUMBA_AVAILABLE = numba_available
+        
+    assert fallback.get_state().asdict() == reference.get_state().asdict()
+    assert fallback.event_log == reference.event_log
+    for seconds, result in ((12.0, history), (200.0, full_history)):
+        expected = reference.get_history(last_n_seconds=seconds)
+        for key in ('time', 'state', 'data_request'):
+            assert isinstance(result[key], array), f"{key} should be an array.array"
+            assert list(result[key]) == expected[key].tolist(), f"{key} history differs"
+    assert len(full_history['state']) == reference.max_history_length
+    
+    print("  [OK] PASSED")
+
+
 def run_all_tests():
     """Run all test cases"""
     print("="*60)
@@ -211,6 +467,15 @@ def run_all_tests():
         test_state_persistence_during_data,
         test_transition_count,
         test_get_state_snapshot,
+        test_tick_n_matches_tick,
+        test_state_snapshot_reused,
+        test_run_ticks_until_push,
+        test_run_vectorized_matches_tick,
+        test_run_with_data_events,
+        test_advance_to_next_event,
+        test_run_sweep,
+        test_event_log,
+        test_array_history_fallback,
     ]
     
     passed = 0